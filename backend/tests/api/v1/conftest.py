@@ -0,0 +1,87 @@
+"""Shared fixtures for API v1 contract tests."""
+
+from contextlib import contextmanager
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+_VALID_UI_PAYLOAD = MappingProxyType(
+    {
+        "environment": "development",
+        "api_base_url": "http://localhost:8000",
+        "theme": "auto",
+        "theme_source": "telegram",
+        "language": "en",
+        "language_source": "telegram",
+        "safe_area_top": 44,
+        "safe_area_bottom": 34,
+        "safe_area_left": 0,
+        "safe_area_right": 0,
+        "features": {"enableDebugLogging": True, "enableErrorReporting": False},
+    }
+)
+
+_CORRELATION_ID = "00000000-0000-4000-8000-000000000000"
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Headers that authenticate requests as the default test user."""
+    return {"x-user-id": "123456789"}
+
+
+@pytest.fixture
+def stub_ui_config_db(monkeypatch):
+    """Stub UI configuration DB calls: no stored config, creates/updates accepted."""
+    import calorie_track_ai_bot.api.v1.config as cfg
+
+    monkeypatch.setattr(cfg, "db_get_ui_configuration", AsyncMock(return_value=None))
+    monkeypatch.setattr(cfg, "db_create_ui_configuration", AsyncMock())
+    monkeypatch.setattr(cfg, "db_update_ui_configuration", AsyncMock(return_value=None))
+
+
+@pytest.fixture(scope="session")
+def correlated_auth_headers(auth_headers):
+    """``auth_headers`` plus a fixed ``x-correlation-id``."""
+    return {**auth_headers, "x-correlation-id": _CORRELATION_ID}
+
+
+@pytest.fixture(scope="session")
+def json_auth_headers(auth_headers):
+    """``auth_headers`` plus a JSON content type, for requests sent with ``content=``."""
+    return {**auth_headers, "content-type": "application/json"}
+
+
+@pytest.fixture(scope="session")
+def valid_ui_payload():
+    """Read-only PUT /api/v1/config/ui payload; copy with ``{**valid_ui_payload, ...}``."""
+    return _VALID_UI_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def valid_ui_payload_bytes():
+    """``valid_ui_payload`` serialized once, for ``content=`` request bodies."""
+    import orjson
+
+    return orjson.dumps(dict(_VALID_UI_PAYLOAD))
+
+
+@pytest.fixture(scope="session")
+def router_client():
+    """Return a context manager that serves a single router from a bare app.
+
+    Routers are stateless, so modules wrap it in a module-scoped ``client``
+    fixture and build the app once.
+    """
+
+    @contextmanager
+    def open_client(router):
+        app = FastAPI()
+        app.include_router(router)
+        with TestClient(app) as test_client:
+            yield test_client
+
+    return open_client
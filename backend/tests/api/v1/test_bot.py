@@ -1,25 +1,16 @@
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 
-from calorie_track_ai_bot.main import app
 
-
-class TestBotWebhook:
-    """Test cases for the Telegram bot webhook handler."""
-
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_webhook_start_command(self, client):
-        """Test webhook handling of /start command."""
-        webhook_data = {
+def _text_update(message_id: int, text: str) -> bytes:
+    """Serialize a private-chat text update from the test user."""
+    return orjson.dumps(
+        {
             "update_id": 123456789,
             "message": {
-                "message_id": 1,
+                "message_id": message_id,
                 "from": {
                     "id": 12345,
                     "is_bot": False,
@@ -33,20 +24,21 @@ class TestBotWebhook:
                     "type": "private",
                 },
                 "date": 1640995200,
-                "text": "/start",
+                "text": text,
             },
         }
+    )
 
-        with patch("calorie_track_ai_bot.api.v1.bot.db_get_or_create_user") as mock_create_user:
-            mock_create_user.return_value = "user-123"
 
-            response = client.post("/bot", json=webhook_data)
+_START_UPDATE = _text_update(1, "/start")
+_TEXT_UPDATE = _text_update(3, "Hello, bot!")
+_EMPTY_UPDATE = orjson.dumps({"update_id": 123456789})
+_INVALID_UPDATE = orjson.dumps({"invalid": "data"})
+_JSON_HEADERS = {"content-type": "application/json"}
 
-            assert response.status_code == 200
-            assert response.json() == {"status": "ok"}
-            mock_create_user.assert_called_once_with(
-                telegram_id=12345, handle="testuser", locale="en"
-            )
+
+class TestBotWebhook:
+    """Test cases for the Telegram bot webhook handler."""
 
     def test_webhook_photo_message(self, client):
         """Test webhook handling of photo message."""
@@ -137,48 +129,37 @@ class TestBotWebhook:
             mock_create_photo.assert_not_called()
             mock_enqueue.assert_not_called()
 
-    def test_webhook_text_message(self, client):
-        """Test webhook handling of text message."""
-        webhook_data = {
-            "update_id": 123456789,
-            "message": {
-                "message_id": 3,
-                "from": {
-                    "id": 12345,
-                    "is_bot": False,
-                    "first_name": "Test",
-                    "username": "testuser",
-                },
-                "chat": {
-                    "id": 12345,
-                    "first_name": "Test",
-                    "username": "testuser",
-                    "type": "private",
-                },
-                "date": 1640995200,
-                "text": "Hello, bot!",
-            },
-        }
-
-        response = client.post("/bot", json=webhook_data)
-
-        assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
-
-    def test_webhook_no_message(self, client):
-        """Test webhook handling when no message is present."""
-        webhook_data = {"update_id": 123456789}
-
-        response = client.post("/bot", json=webhook_data)
-
-        assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+    @pytest.mark.parametrize(
+        ("payload", "expected_status", "expected_body", "expected_user_call"),
+        [
+            (
+                _START_UPDATE,
+                200,
+                {"status": "ok"},
+                {"telegram_id": 12345, "handle": "testuser", "locale": "en"},
+            ),
+            (_TEXT_UPDATE, 200, {"status": "ok"}, None),
+            (_EMPTY_UPDATE, 200, {"status": "ok"}, None),
+            (_INVALID_UPDATE, 500, None, None),
+        ],
+        ids=["start_command", "text_message", "no_message", "invalid_data"],
+    )
+    def test_webhook_dispatch(
+        self, client, payload, expected_status, expected_body, expected_user_call
+    ):
+        """Test webhook routing of /start, plain text, empty and malformed updates."""
+        with patch("calorie_track_ai_bot.api.v1.bot.db_get_or_create_user") as mock_create_user:
+            mock_create_user.return_value = "user-123"
 
-    def test_webhook_invalid_data(self, client):
-        """Test webhook handling with invalid data."""
-        response = client.post("/bot", json={"invalid": "data"})
+            response = client.post("/bot", content=payload, headers=_JSON_HEADERS)
 
-        assert response.status_code == 500
+        assert response.status_code == expected_status
+        if expected_body is not None:
+            assert response.json() == expected_body
+        if expected_user_call is None:
+            mock_create_user.assert_not_called()
+        else:
+            mock_create_user.assert_called_once_with(**expected_user_call)
 
     def test_webhook_photo_processing_error(self, client):
         """Test webhook handling when photo processing fails."""
@@ -1,192 +1,247 @@
 """Contract tests for Telegram inline webhook handling."""
 
-from unittest.mock import patch
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import ANY, AsyncMock, patch
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-from calorie_track_ai_bot.main import app
 from calorie_track_ai_bot.schemas import InlineChatType, InlineTriggerType
 
+_BASE_INLINE_QUERY = MappingProxyType({"id": "", "query": "", "chat_type": ""})
+_JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture
-def client() -> TestClient:
-    return TestClient(app)
 
-
-class TestInlineWebhookContracts:
-    """Inline webhook acknowledgement contracts."""
-
-    def test_inline_query_acknowledgement_structure(self, client: TestClient) -> None:
-        """Inline queries should return structured acknowledgement with job metadata."""
-        inline_payload = {
-            "update_id": 555001,
-            "inline_query": {
-                "id": "INLINE123",
-                "from": {
-                    "id": 987654,
-                    "is_bot": False,
-                    "first_name": "Group",
-                    "username": "group_invoker",
-                },
-                "query": '{"file_id": "inline-file-123", "origin_message_id": "orig-321"}',
-                "chat_type": "supergroup",
-            },
+def _inline_update(update_id: int, sender: dict[str, Any], **inline_query: Any) -> bytes:
+    """Serialize an inline_query update, overriding fields of the base query."""
+    return orjson.dumps(
+        {
+            "update_id": update_id,
+            "inline_query": {**_BASE_INLINE_QUERY, "from": sender, **inline_query},
         }
-
-        with (
-            patch(
-                "calorie_track_ai_bot.api.v1.bot.enqueue_inline_job", create=True
-            ) as mock_enqueue,
-            patch(
-                "calorie_track_ai_bot.api.v1.bot.send_inline_query_acknowledgement", create=True
-            ) as mock_ack,
-        ):
-            mock_enqueue.return_value = "job-inline-query-uuid"
-
-            response = client.post("/bot", json=inline_payload)
-
-        assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "ok"
-        assert body["job_id"] == "job-inline-query-uuid"
-        assert body["trigger_type"] == "inline_query"
-
-        mock_enqueue.assert_called_once()
-        _, kwargs = mock_enqueue.call_args
-        assert kwargs["trigger_type"] == InlineTriggerType.inline_query
-        # supergroup requests must be normalised to group analytics buckets
-        assert kwargs["chat_type"] == InlineChatType.group
-        assert kwargs["inline_message_id"] == "INLINE123"
-        assert kwargs["raw_user_id"] == 987654
-        assert kwargs["file_id"] == "inline-file-123"
-        assert kwargs["origin_message_id"] == "orig-321"
-        assert kwargs["raw_chat_id"] is None
-        mock_ack.assert_called_once()
-
-    def test_group_reply_inline_acknowledgement(self, client: TestClient) -> None:
-        """Reply mentions in groups should enqueue inline jobs with reply metadata."""
-        inline_reply_payload = {
-            "update_id": 555002,
-            "message": {
-                "message_id": 84,
-                "message_thread_id": 777,
-                "date": 1710001111,
+    )
+
+
+_GROUP_QUERY = '{"file_id": "inline-file-123", "origin_message_id": "orig-321"}'
+_GROUP_INLINE_UPDATE = _inline_update(
+    555001,
+    {
+        "id": 987654,
+        "is_bot": False,
+        "first_name": "Group",
+        "username": "group_invoker",
+    },
+    id="INLINE123",
+    query=_GROUP_QUERY,
+    chat_type="supergroup",
+)
+_PRIVATE_INLINE_UPDATE = _inline_update(
+    555010,
+    {
+        "id": 43210,
+        "is_bot": False,
+        "first_name": "Solo",
+        "username": "solo_user",
+    },
+    id="INLINE999",
+    query='{"file_id": "private-file-777", "chat_id": 43210}',
+    chat_type="private",
+)
+
+
+_REPLY_MENTION_UPDATE = orjson.dumps(
+    {
+        "update_id": 555002,
+        "message": {
+            "message_id": 84,
+            "message_thread_id": 777,
+            "date": 1710001111,
+            "chat": {
+                "id": -100999888777,
+                "type": "supergroup",
+                "title": "Inline Testers",
+            },
+            "from": {
+                "id": 24680,
+                "is_bot": False,
+                "first_name": "Reply",
+                "username": "reply_captain",
+            },
+            "text": "@CalorieTrackAI_bot please analyse this",
+            "entities": [
+                {
+                    "type": "mention",
+                    "offset": 0,
+                    "length": 18,
+                }
+            ],
+            "reply_to_message": {
+                "message_id": 42,
+                "date": 1710000000,
                 "chat": {
                     "id": -100999888777,
                     "type": "supergroup",
-                    "title": "Inline Testers",
                 },
                 "from": {
-                    "id": 24680,
+                    "id": 13579,
                     "is_bot": False,
-                    "first_name": "Reply",
-                    "username": "reply_captain",
+                    "first_name": "Photographer",
                 },
-                "text": "@CalorieTrackAI_bot please analyse this",
-                "entities": [
+                "photo": [
                     {
-                        "type": "mention",
-                        "offset": 0,
-                        "length": 18,
+                        "file_id": "abc123",
+                        "file_unique_id": "unique-photo",
+                        "file_size": 2048,
+                        "width": 800,
+                        "height": 600,
                     }
                 ],
-                "reply_to_message": {
-                    "message_id": 42,
-                    "date": 1710000000,
-                    "chat": {
-                        "id": -100999888777,
-                        "type": "supergroup",
-                    },
-                    "from": {
-                        "id": 13579,
-                        "is_bot": False,
-                        "first_name": "Photographer",
-                    },
-                    "photo": [
-                        {
-                            "file_id": "abc123",
-                            "file_unique_id": "unique-photo",
-                            "file_size": 2048,
-                            "width": 800,
-                            "height": 600,
-                        }
-                    ],
-                },
             },
-        }
+        },
+    }
+)
+
+# (id, payload, queue job id, trigger type, expected enqueue kwargs, acknowledgement helper)
+_CASES = [
+    (
+        "inline_query_group",
+        _GROUP_INLINE_UPDATE,
+        "job-inline-query-uuid",
+        InlineTriggerType.inline_query,
+        {
+            "job_id": ANY,
+            "trigger_type": InlineTriggerType.inline_query,
+            # supergroup requests must be normalised to group analytics buckets
+            "chat_type": InlineChatType.group,
+            "file_id": "inline-file-123",
+            "raw_chat_id": None,
+            "raw_user_id": 987654,
+            "inline_message_id": "INLINE123",
+            "origin_message_id": "orig-321",
+            "thread_id": None,
+            "consent_scope": "inline_processing",
+            "metadata": {"query": _GROUP_QUERY, "via_bot": None},
+        },
+        "ack",
+    ),
+    (
+        "reply_mention_group",
+        _REPLY_MENTION_UPDATE,
+        "job-inline-reply-uuid",
+        InlineTriggerType.reply_mention,
+        {
+            "job_id": ANY,
+            "trigger_type": InlineTriggerType.reply_mention,
+            "chat_type": InlineChatType.group,
+            "file_id": "abc123",
+            "raw_chat_id": -100999888777,
+            "raw_user_id": 24680,
+            "reply_to_message_id": 42,
+            "thread_id": 777,
+            "origin_message_id": "42",
+            "metadata": {
+                "reply_author_id": 13579,
+                "media_group_id": None,
+                "chat_title": "Inline Testers",
+                "failure_dm_required": True,
+            },
+        },
+        "placeholder",
+    ),
+    (
+        "inline_query_private",
+        _PRIVATE_INLINE_UPDATE,
+        "job-inline-private-uuid",
+        InlineTriggerType.inline_query,
+        {
+            "job_id": ANY,
+            "trigger_type": InlineTriggerType.inline_query,
+            "chat_type": InlineChatType.private,
+            "file_id": "private-file-777",
+            "raw_chat_id": 43210,
+            "raw_user_id": 43210,
+            "inline_message_id": "INLINE999",
+            "origin_message_id": None,
+            "thread_id": None,
+            "consent_scope": "inline_private",
+            "metadata": {
+                "query": '{"file_id": "private-file-777", "chat_id": 43210}',
+                "via_bot": None,
+                "privacy_notice": True,
+                "usage_guide_ref": ANY,
+            },
+        },
+        "ack",
+    ),
+]
+
+
+class TestInlineWebhookContracts:
+    """Inline webhook acknowledgement contracts."""
 
+    @pytest.fixture(autouse=True)
+    def inline_mocks(self):
+        """Patch the inline queue and Telegram acknowledgement helpers once per test."""
         with (
             patch(
-                "calorie_track_ai_bot.api.v1.bot.enqueue_inline_job", create=True
+                "calorie_track_ai_bot.api.v1.bot.enqueue_inline_job",
+                new_callable=AsyncMock,
+                create=True,
             ) as mock_enqueue,
             patch(
-                "calorie_track_ai_bot.api.v1.bot.send_group_inline_placeholder", create=True
-            ) as _mock_placeholder,
+                "calorie_track_ai_bot.api.v1.bot.send_inline_query_acknowledgement",
+                new_callable=AsyncMock,
+                create=True,
+            ) as mock_ack,
+            patch(
+                "calorie_track_ai_bot.api.v1.bot.send_group_inline_placeholder",
+                new_callable=AsyncMock,
+                create=True,
+            ) as mock_placeholder,
         ):
-            mock_enqueue.return_value = "job-inline-reply-uuid"
-
-            response = client.post("/bot", json=inline_reply_payload)
+            yield SimpleNamespace(enqueue=mock_enqueue, ack=mock_ack, placeholder=mock_placeholder)
+
+    @pytest.mark.parametrize(
+        ("payload", "queue_job_id", "trigger_type", "enqueue_kwargs", "notifier"),
+        [case[1:] for case in _CASES],
+        ids=[case[0] for case in _CASES],
+    )
+    def test_inline_update_acknowledgement(
+        self,
+        client: TestClient,
+        inline_mocks: SimpleNamespace,
+        payload: bytes,
+        queue_job_id: str,
+        trigger_type: InlineTriggerType,
+        enqueue_kwargs: dict[str, Any],
+        notifier: str,
+    ) -> None:
+        """Inline updates should return structured acknowledgement with job metadata."""
+        inline_mocks.enqueue.return_value = queue_job_id
+
+        response = client.post("/bot", content=payload, headers=_JSON_HEADERS)
 
         assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "ok"
-        assert body["job_id"] == "job-inline-reply-uuid"
-        assert body["trigger_type"] == "reply_mention"
-
-        mock_enqueue.assert_called_once()
-        _, kwargs = mock_enqueue.call_args
-        assert kwargs["trigger_type"] == InlineTriggerType.reply_mention
-        assert kwargs["chat_type"] == InlineChatType.group
-        assert kwargs["reply_to_message_id"] == 42
-        assert kwargs["thread_id"] == 777
-        assert kwargs["raw_chat_id"] == -100999888777
-        assert kwargs["raw_user_id"] == 24680
-
-    def test_private_inline_query_includes_disclaimer_placeholder(self, client: TestClient) -> None:
-        """Private inline queries should include privacy disclaimers in placeholder results."""
-        inline_payload = {
-            "update_id": 555010,
-            "inline_query": {
-                "id": "INLINE999",
-                "from": {
-                    "id": 43210,
-                    "is_bot": False,
-                    "first_name": "Solo",
-                    "username": "solo_user",
-                },
-                "query": '{"file_id": "private-file-777", "chat_id": 43210}',
-                "chat_type": "private",
-            },
+        assert response.json() == {
+            "status": "ok",
+            "job_id": queue_job_id,
+            "trigger_type": trigger_type.value,
         }
+        inline_mocks.enqueue.assert_awaited_once_with(**enqueue_kwargs)
+        getattr(inline_mocks, notifier).assert_awaited_once()
 
-        with (
-            patch(
-                "calorie_track_ai_bot.api.v1.bot.enqueue_inline_job", create=True
-            ) as mock_enqueue,
-            patch(
-                "calorie_track_ai_bot.api.v1.bot.send_inline_query_acknowledgement", create=True
-            ) as mock_ack,
-        ):
-            mock_enqueue.return_value = "job-inline-private-uuid"
+    def test_private_inline_query_includes_disclaimer_placeholder(
+        self, client: TestClient, inline_mocks: SimpleNamespace
+    ) -> None:
+        """Private inline queries should include privacy disclaimers in placeholder results."""
+        inline_mocks.enqueue.return_value = "job-inline-private-uuid"
 
-            response = client.post("/bot", json=inline_payload)
+        response = client.post("/bot", content=_PRIVATE_INLINE_UPDATE, headers=_JSON_HEADERS)
 
         assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "ok"
-        assert body["job_id"] == "job-inline-private-uuid"
-        assert body["trigger_type"] == "inline_query"
-
-        mock_enqueue.assert_called_once()
-        _, enqueue_kwargs = mock_enqueue.call_args
-        assert enqueue_kwargs["trigger_type"] == InlineTriggerType.inline_query
-        assert enqueue_kwargs["chat_type"] == InlineChatType.private
-        assert enqueue_kwargs["file_id"] == "private-file-777"
-        assert enqueue_kwargs["metadata"]["privacy_notice"] is True
-
-        mock_ack.assert_called_once()
-        ack_kwargs = mock_ack.call_args.kwargs
+        ack_kwargs = inline_mocks.ack.await_args.kwargs
         assert ack_kwargs["trigger_type"] == InlineTriggerType.inline_query
         placeholder_text = ack_kwargs["placeholder_text"]
         assert "Privacy notice" in placeholder_text
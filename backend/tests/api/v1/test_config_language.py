@@ -1,103 +1,119 @@
 import re
-import uuid
 from datetime import datetime
+from typing import Annotated
 
-from fastapi.testclient import TestClient
+import msgspec
+import orjson
+import pytest
 
-from src.calorie_track_ai_bot.main import app
-from src.calorie_track_ai_bot.schemas import LanguageDetectionResponse, LanguageSource
+from calorie_track_ai_bot.schemas import LanguageDetectionResponse, LanguageSource
 
-client = TestClient(app)
+pytestmark = pytest.mark.api_contract
 
-HEADERS = {"x-user-id": "123456789"}
+_LANG_SRCS = frozenset(("telegram", "browser", "manual"))
+_FALLBACK_SRCS = frozenset(("browser", "manual"))
+_LANGS = frozenset(("en", "ru"))
+
+_LANG_RE = re.compile(r"^[a-z]{2}(-[A-Z]{2})?$")
+
+
+class _LanguageDetectionStruct(msgspec.Struct):
+    """msgspec mirror of LanguageDetectionResponse, decoded straight from bytes."""
+
+    language: str
+    language_source: LanguageSource
+    detected_at: Annotated[datetime, msgspec.Meta(tz=True)]
+    supported_languages: list[str]
+    telegram_language_code: str | None = None
+    browser_language: str | None = None
+
+
+_DEC = msgspec.json.Decoder(_LanguageDetectionStruct)
 
 
 class TestConfigLanguageContract:
-    def test_get_language_config_returns_200_with_valid_schema(self):
-        response = client.get("/api/v1/config/language", headers=HEADERS)
+    def test_get_language_config_returns_200_with_valid_schema(self, client, auth_headers):
+        response = client.get("/api/v1/config/language", headers=auth_headers)
+
+        assert response.status_code == 200
+
+        language_response = _DEC.decode(response.content)
+        assert language_response.language_source in _LANG_SRCS
+        assert language_response.language in _LANGS
+
+    def test_get_language_config_matches_pydantic_schema(self, client, auth_headers):
+        response = client.get("/api/v1/config/language", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-
-        language_response = LanguageDetectionResponse(**data)
-        assert language_response.language_source in [
-            LanguageSource.telegram,
-            LanguageSource.browser,
-            LanguageSource.manual,
-        ]
-        assert isinstance(language_response.detected_at, datetime)
-        assert language_response.language in ["en", "ru"]
-
-    def test_get_language_config_with_telegram_headers(self):
+        pydantic_response = LanguageDetectionResponse.model_validate_json(response.content)
+        assert msgspec.structs.asdict(_DEC.decode(response.content)) == (
+            pydantic_response.model_dump()
+        )
+
+    def test_get_language_config_with_telegram_headers(self, client, auth_headers):
         response = client.get(
             "/api/v1/config/language",
             headers={
-                **HEADERS,
+                **auth_headers,
                 "x-telegram-language-code": "es",
             },
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["language_source"] in ["telegram", "browser", "manual"]
-        assert re.match(r"^[a-z]{2}(-[A-Z]{2})?$", data["language"])
+        data = orjson.loads(response.content)
+        assert data["language_source"] in _LANG_SRCS
+        assert _LANG_RE.match(data["language"])
 
-    def test_get_language_config_with_browser_preference(self):
+    def test_get_language_config_with_browser_preference(self, client, auth_headers):
         response = client.get(
             "/api/v1/config/language",
-            headers={**HEADERS, "accept-language": "fr-FR,fr;q=0.9,en;q=0.8"},
+            headers={**auth_headers, "accept-language": "fr-FR,fr;q=0.9,en;q=0.8"},
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["language_source"] in ["telegram", "browser", "manual"]
+        data = orjson.loads(response.content)
+        assert data["language_source"] in _LANG_SRCS
         assert data["language"] == "en"
 
-    def test_get_language_config_validates_supported_languages(self):
-        response = client.get("/api/v1/config/language", headers=HEADERS)
+    def test_get_language_config_validates_supported_languages(self, client, auth_headers):
+        response = client.get("/api/v1/config/language", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-        assert "supported_languages" in data
-        assert isinstance(data["supported_languages"], list)
-        assert len(data["supported_languages"]) > 0
+        assert orjson.loads(response.content)["supported_languages"] == ["en", "ru"]
 
-        expected_languages = ["en", "ru"]
-        assert data["supported_languages"] == expected_languages
-
-    def test_get_language_config_fallback_to_default(self):
+    def test_get_language_config_fallback_to_default(self, client, auth_headers):
         response = client.get(
             "/api/v1/config/language",
-            headers={**HEADERS, "accept-language": "xx-XX"},
+            headers={**auth_headers, "accept-language": "xx-XX"},
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["language"] == "en"
-        assert data["language_source"] in ["browser", "manual"]
+        assert data["language_source"] in _FALLBACK_SRCS
 
-    def test_get_language_config_validates_correlation_id(self):
-        correlation_id = str(uuid.uuid4())
+    def test_get_language_config_validates_correlation_id(self, client, correlated_auth_headers):
         response = client.get(
             "/api/v1/config/language",
-            headers={**HEADERS, "x-correlation-id": correlation_id},
+            headers=correlated_auth_headers,
         )
 
         assert response.status_code == 200
 
-    def test_get_language_config_requires_authentication(self):
-        response = client.get("/api/v1/config/language")
+    async def test_get_language_config_requires_authentication(self, async_client):
+        response = await async_client.get("/api/v1/config/language")
         assert response.status_code == 401
 
-    def test_get_language_config_performance_requirement(self):
-        import time
-
-        start_time = time.perf_counter()
-        response = client.get("/api/v1/config/language", headers=HEADERS)
-        end_time = time.perf_counter()
-        response_time_ms = (end_time - start_time) * 1000
+    @pytest.mark.benchmark
+    def test_get_language_config_performance_requirement(self, client, auth_headers, benchmark):
+        response = benchmark.pedantic(
+            client.get,
+            args=("/api/v1/config/language",),
+            kwargs={"headers": auth_headers},
+            rounds=50,
+            warmup_rounds=5,
+        )
 
         assert response.status_code == 200
-        assert response_time_ms < 200, (
-            f"Response time was {response_time_ms:.2f}ms, expected < 200ms"
-        )
+        median_ms = benchmark.stats.stats.median * 1000
+        assert median_ms < 50, f"Median response time was {median_ms:.2f}ms, expected < 50ms"
@@ -1,85 +1,111 @@
-import uuid
 from datetime import datetime
+from typing import Annotated
 
-from fastapi.testclient import TestClient
+import msgspec
+import orjson
+import pytest
 
-from src.calorie_track_ai_bot.main import app
-from src.calorie_track_ai_bot.schemas import Theme, ThemeDetectionResponse, ThemeSource
+from calorie_track_ai_bot.schemas import Theme, ThemeDetectionResponse, ThemeSource
 
-client = TestClient(app)
+pytestmark = pytest.mark.api_contract
 
-HEADERS = {"x-user-id": "123456789"}
+_THEMES = frozenset(("light", "dark", "auto"))
+_THEME_SRCS = frozenset(("telegram", "system", "manual"))
+
+
+class _ThemeDetectionStruct(msgspec.Struct):
+    """msgspec mirror of ThemeDetectionResponse, decoded straight from bytes."""
+
+    theme: Theme
+    theme_source: ThemeSource
+    detected_at: Annotated[datetime, msgspec.Meta(tz=True)]
+    telegram_color_scheme: str | None = None
+    system_prefers_dark: bool | None = None
+
+
+_DEC = msgspec.json.Decoder(_ThemeDetectionStruct)
+
+
+@pytest.fixture(scope="module")
+def telegram_dark_headers(auth_headers):
+    return {
+        **auth_headers,
+        "x-telegram-color-scheme": "dark",
+        "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)",
+    }
+
+
+@pytest.fixture(scope="module")
+def system_dark_headers(auth_headers):
+    return {**auth_headers, "sec-ch-prefers-color-scheme": "dark"}
 
 
 class TestConfigThemeContract:
-    def test_get_theme_config_returns_200_with_valid_schema(self):
-        response = client.get("/api/v1/config/theme", headers=HEADERS)
+    async def test_get_theme_config_returns_200_with_valid_schema(self, async_client, auth_headers):
+        response = await async_client.get("/api/v1/config/theme", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-
-        theme_response = ThemeDetectionResponse(**data)
-        assert theme_response.theme in [Theme.light, Theme.dark, Theme.auto]
-        assert theme_response.theme_source in [
-            ThemeSource.telegram,
-            ThemeSource.system,
-            ThemeSource.manual,
-        ]
+
+        theme_response = _DEC.decode(response.content)
+        assert theme_response.theme in _THEMES
+        assert theme_response.theme_source in _THEME_SRCS
         assert (
             isinstance(theme_response.telegram_color_scheme, str)
             or theme_response.telegram_color_scheme is None
         )
         assert isinstance(theme_response.system_prefers_dark, bool)
-        assert isinstance(theme_response.detected_at, datetime)
 
-    def test_get_theme_config_with_telegram_headers(self):
-        response = client.get(
-            "/api/v1/config/theme",
-            headers={
-                **HEADERS,
-                "x-telegram-color-scheme": "dark",
-                "user-agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)",
-            },
-        )
+    async def test_get_theme_config_matches_pydantic_schema(self, async_client, auth_headers):
+        response = await async_client.get("/api/v1/config/theme", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["theme"] in ["light", "dark", "auto"]
-        assert data["theme_source"] in ["telegram", "system", "manual"]
-
-    def test_get_theme_config_with_system_preference(self):
-        response = client.get(
-            "/api/v1/config/theme",
-            headers={**HEADERS, "sec-ch-prefers-color-scheme": "dark"},
+        pydantic_response = ThemeDetectionResponse.model_validate_json(response.content)
+        assert msgspec.structs.asdict(_DEC.decode(response.content)) == (
+            pydantic_response.model_dump()
         )
 
+    async def test_get_theme_config_with_telegram_headers(
+        self, async_client, telegram_dark_headers
+    ):
+        response = await async_client.get("/api/v1/config/theme", headers=telegram_dark_headers)
+
         assert response.status_code == 200
-        data = response.json()
-        assert data["theme"] in ["light", "dark", "auto"]
-        assert data["theme_source"] in ["telegram", "system", "manual"]
+        data = orjson.loads(response.content)
+        assert data["theme"] in _THEMES
+        assert data["theme_source"] in _THEME_SRCS
 
-    def test_get_theme_config_validates_correlation_id(self):
-        correlation_id = str(uuid.uuid4())
-        response = client.get(
+    async def test_get_theme_config_with_system_preference(self, async_client, system_dark_headers):
+        response = await async_client.get("/api/v1/config/theme", headers=system_dark_headers)
+
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert data["theme"] in _THEMES
+        assert data["theme_source"] in _THEME_SRCS
+
+    async def test_get_theme_config_validates_correlation_id(
+        self, async_client, correlated_auth_headers
+    ):
+        response = await async_client.get(
             "/api/v1/config/theme",
-            headers={**HEADERS, "x-correlation-id": correlation_id},
+            headers=correlated_auth_headers,
         )
 
         assert response.status_code == 200
 
-    def test_get_theme_config_requires_authentication(self):
-        response = client.get("/api/v1/config/theme")
+    async def test_get_theme_config_requires_authentication(self, async_client):
+        response = await async_client.get("/api/v1/config/theme")
         assert response.status_code == 401
 
-    def test_get_theme_config_performance_requirement(self):
-        import time
-
-        start_time = time.perf_counter()
-        response = client.get("/api/v1/config/theme", headers=HEADERS)
-        end_time = time.perf_counter()
-        response_time_ms = (end_time - start_time) * 1000
+    @pytest.mark.benchmark
+    def test_get_theme_config_performance_requirement(self, client, auth_headers, benchmark):
+        response = benchmark.pedantic(
+            client.get,
+            args=("/api/v1/config/theme",),
+            kwargs={"headers": auth_headers},
+            rounds=50,
+            warmup_rounds=5,
+        )
 
         assert response.status_code == 200
-        assert response_time_ms < 200, (
-            f"Response time was {response_time_ms:.2f}ms, expected < 200ms"
-        )
+        median_ms = benchmark.stats.stats.median * 1000
+        assert median_ms < 50, f"Median response time was {median_ms:.2f}ms, expected < 50ms"
@@ -1,169 +1,94 @@
 """Contract tests for PUT /api/v1/config/ui endpoint."""
 
-from datetime import UTC
-from unittest.mock import AsyncMock, patch
-
-from fastapi.testclient import TestClient
-
-from calorie_track_ai_bot.main import app
-
-client = TestClient(app)
-
-HEADERS = {"x-user-id": "123456789"}
-
-
-def _patch_db():
-    """Patch DB calls to return None (no existing config) and accept creates."""
-    return (
-        patch(
-            "calorie_track_ai_bot.api.v1.config.db_get_ui_configuration",
-            new_callable=AsyncMock,
-            return_value=None,
-        ),
-        patch(
-            "calorie_track_ai_bot.api.v1.config.db_create_ui_configuration",
-            new_callable=AsyncMock,
-        ),
-        patch(
-            "calorie_track_ai_bot.api.v1.config.db_update_ui_configuration",
-            new_callable=AsyncMock,
-            return_value=None,
-        ),
-    )
-
-
-class TestUIConfigPutContract:
-    def test_put_ui_config_with_valid_data_returns_200(self):
-        valid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "auto",
-            "theme_source": "telegram",
-            "language": "en",
-            "language_source": "telegram",
-            "safe_area_top": 44,
-            "safe_area_bottom": 34,
-            "safe_area_left": 0,
-            "safe_area_right": 0,
-            "features": {"enableDebugLogging": True, "enableErrorReporting": False},
-        }
-
-        p1, p2, p3 = _patch_db()
-        with p1, p2, p3:
-            response = client.put("/api/v1/config/ui", json=valid_payload, headers=HEADERS)
-
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/json"
+from datetime import datetime
+from time import time
 
-        data = response.json()
-        assert data["environment"] == valid_payload["environment"]
-        assert data["api_base_url"] == valid_payload["api_base_url"]
-        assert data["theme"] == valid_payload["theme"]
-        assert data["theme_source"] == valid_payload["theme_source"]
-        assert data["language"] == valid_payload["language"]
-        assert data["language_source"] == valid_payload["language_source"]
+import orjson
+import pytest
 
-    def test_put_ui_config_validates_environment(self):
-        invalid_payload = {
-            "environment": "invalid_env",
-            "api_base_url": "http://localhost:8000",
-            "theme": "light",
-        }
+pytestmark = [pytest.mark.api_contract, pytest.mark.usefixtures("stub_ui_config_db")]
 
-        response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
+_THEME_ONLY_BODY = orjson.dumps({"theme": "light"})
+_JSON_HEADERS = {"content-type": "application/json"}
 
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-        assert any("environment" in str(err) for err in data["detail"])
-
-    def test_put_ui_config_validates_theme(self):
-        invalid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "invalid_theme",
-        }
 
-        response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
+class TestUIConfigPutContract:
+    async def test_put_ui_config_with_valid_data_returns_200(
+        self, async_client, json_auth_headers, valid_ui_payload, valid_ui_payload_bytes
+    ):
+        response = await async_client.put(
+            "/api/v1/config/ui", content=valid_ui_payload_bytes, headers=json_auth_headers
+        )
 
-        assert response.status_code == 422
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
 
-    def test_put_ui_config_validates_theme_source(self):
-        invalid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "light",
-            "theme_source": "invalid_source",
-        }
+        data = orjson.loads(response.content)
+        assert data["environment"] == valid_ui_payload["environment"]
+        assert data["api_base_url"] == valid_ui_payload["api_base_url"]
+        assert data["theme"] == valid_ui_payload["theme"]
+        assert data["theme_source"] == valid_ui_payload["theme_source"]
+        assert data["language"] == valid_ui_payload["language"]
+        assert data["language_source"] == valid_ui_payload["language_source"]
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("environment", "invalid_env"),
+            ("theme", "invalid_theme"),
+            ("theme_source", "invalid_source"),
+        ],
+        ids=["environment", "theme", "theme_source"],
+    )
+    async def test_put_ui_config_rejects_invalid_enum(
+        self, async_client, json_auth_headers, valid_ui_payload, field, value
+    ):
+        invalid_payload = orjson.dumps({**valid_ui_payload, field: value})
 
-        response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
+        response = await async_client.put(
+            "/api/v1/config/ui", content=invalid_payload, headers=json_auth_headers
+        )
 
         assert response.status_code == 422
+        assert any(field in str(err) for err in orjson.loads(response.content)["detail"])
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("language", "invalid-lang-code"),
+            ("safe_area_top", -5),
+            ("api_base_url", "not-a-valid-url"),
+        ],
+        ids=["language", "safe_area", "api_base_url"],
+    )
+    async def test_put_ui_config_validates_field(
+        self, async_client, json_auth_headers, valid_ui_payload, field, value
+    ):
+        invalid_payload = orjson.dumps({**valid_ui_payload, field: value})
 
-    def test_put_ui_config_validates_language_format(self):
-        invalid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "light",
-            "language": "invalid-lang-code",
-        }
-
-        p1, p2, p3 = _patch_db()
-        with p1, p2, p3:
-            response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
-
-        assert response.status_code == 400
-
-    def test_put_ui_config_validates_safe_areas(self):
-        invalid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "light",
-            "safe_area_top": -5,
-        }
-
-        p1, p2, p3 = _patch_db()
-        with p1, p2, p3:
-            response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
-
-        assert response.status_code == 400
-
-    def test_put_ui_config_validates_api_base_url(self):
-        invalid_payload = {
-            "environment": "development",
-            "api_base_url": "not-a-valid-url",
-            "theme": "light",
-        }
-
-        p1, p2, p3 = _patch_db()
-        with p1, p2, p3:
-            response = client.put("/api/v1/config/ui", json=invalid_payload, headers=HEADERS)
+        response = await async_client.put(
+            "/api/v1/config/ui", content=invalid_payload, headers=json_auth_headers
+        )
 
         assert response.status_code == 400
 
-    def test_put_ui_config_returns_updated_timestamps(self):
-        valid_payload = {
-            "environment": "development",
-            "api_base_url": "http://localhost:8000",
-            "theme": "light",
-        }
+    async def test_put_ui_config_returns_updated_timestamps(
+        self, async_client, json_auth_headers, valid_ui_payload_bytes
+    ):
+        response = await async_client.put(
+            "/api/v1/config/ui", content=valid_ui_payload_bytes, headers=json_auth_headers
+        )
 
-        p1, p2, p3 = _patch_db()
-        with p1, p2, p3:
-            response = client.put("/api/v1/config/ui", json=valid_payload, headers=HEADERS)
-
-        if response.status_code == 200:
-            data = response.json()
-            assert "updated_at" in data
-            assert "created_at" in data
-
-            from datetime import datetime
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert "updated_at" in data
+        assert "created_at" in data
 
-            updated_at = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            now = datetime.now(UTC)
-            time_diff = (now - updated_at).total_seconds()
-            assert time_diff < 5
+        updated_at = datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")).timestamp()
+        assert time() - updated_at < 5
 
-    def test_put_ui_config_requires_authentication(self):
-        response = client.put("/api/v1/config/ui", json={"theme": "light"})
+    async def test_put_ui_config_requires_authentication(self, async_client):
+        response = await async_client.put(
+            "/api/v1/config/ui", content=_THEME_ONLY_BODY, headers=_JSON_HEADERS
+        )
         assert response.status_code == 401
@@ -1,24 +1,46 @@
 """Tests for daily summary API endpoints with user ID detection."""
 
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
 
-from calorie_track_ai_bot.api.v1.daily_summary import router
+from calorie_track_ai_bot.api.v1 import daily_summary
 
+pytestmark = pytest.mark.api_contract
 
-class TestDailySummaryEndpoints:
-    """Test daily summary-related endpoints with user ID detection."""
+_HEADERS = {"x-user-id": "59357664"}
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from fastapi import FastAPI
 
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
+@pytest.fixture(scope="module")
+def client(router_client):
+    """Test client for the daily summary router."""
+    with router_client(daily_summary.router) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def get_summary(client):
+    """GET /daily-summary/{date} as the test user unless other headers are given."""
+
+    def get(date="2025-09-28", headers=_HEADERS):
+        return client.get(f"/daily-summary/{date}", headers=headers)
+
+    return get
+
+
+@pytest.fixture(scope="module")
+def get_today(client):
+    """GET /today/{date} as the test user unless other headers are given."""
+
+    def get(date="2025-09-28", headers=_HEADERS):
+        return client.get(f"/today/{date}", headers=headers)
+
+    return get
+
+
+class TestDailySummaryEndpoints:
+    """Test daily summary-related endpoints with user ID detection."""
 
     @pytest.fixture
     def mock_daily_summary_data(self):
@@ -68,36 +90,40 @@ class TestDailySummaryEndpoints:
             },
         }
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary")
+    @pytest.fixture
+    def db_mocks(self, monkeypatch):
+        """Replace the daily summary DB calls with AsyncMocks the tests configure."""
+        mocks = SimpleNamespace(summary=AsyncMock(), today=AsyncMock())
+        monkeypatch.setattr(daily_summary, "db_get_daily_summary", mocks.summary)
+        monkeypatch.setattr(daily_summary, "db_get_today_data", mocks.today)
+        return mocks
+
     def test_get_daily_summary_with_telegram_user_id(
-        self, mock_db_get_daily_summary, client, mock_daily_summary_data
+        self, get_summary, db_mocks, mock_daily_summary_data
     ):
         """Test getting daily summary with real Telegram user ID from header."""
-        mock_db_get_daily_summary.return_value = mock_daily_summary_data
+        db_mocks.summary.return_value = mock_daily_summary_data
 
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/daily-summary/2025-09-28", headers=headers)
+        response = get_summary()
 
         assert response.status_code == 200
         data = response.json()
         assert data == mock_daily_summary_data
 
         # Verify that db_get_daily_summary was called with the correct parameters
-        mock_db_get_daily_summary.assert_called_once_with("2025-09-28", "59357664")
+        db_mocks.summary.assert_awaited_once_with("2025-09-28", "59357664")
 
-    def test_get_daily_summary_without_user_id_header(self, client):
+    def test_get_daily_summary_without_user_id_header(self, get_summary):
         """Test getting daily summary without x-user-id header returns 401."""
-        response = client.get("/daily-summary/2025-09-28")
+        response = get_summary(headers=None)
 
         assert response.status_code == 401
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary")
-    def test_get_daily_summary_no_data_found(self, mock_db_get_daily_summary, client):
+    def test_get_daily_summary_no_data_found(self, get_summary, db_mocks):
         """Test getting daily summary when no data exists."""
-        mock_db_get_daily_summary.return_value = None
+        db_mocks.summary.return_value = None
 
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/daily-summary/2025-09-28", headers=headers)
+        response = get_summary()
 
         assert response.status_code == 200
         data = response.json()
@@ -106,166 +132,73 @@ class TestDailySummaryEndpoints:
         assert data["kcal_total"] == 0
         assert data["macros_totals"] == {"protein_g": 0, "fat_g": 0, "carbs_g": 0}
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary")
-    def test_get_daily_summary_database_error(self, mock_db_get_daily_summary, client):
+    def test_get_daily_summary_database_error(self, get_summary, db_mocks):
         """Test getting daily summary when database error occurs."""
-        mock_db_get_daily_summary.side_effect = Exception("Database connection failed")
+        db_mocks.summary.side_effect = Exception("Database connection failed")
 
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/daily-summary/2025-09-28", headers=headers)
+        response = get_summary()
 
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_today_data")
-    def test_get_today_data_with_telegram_user_id(
-        self, mock_db_get_today_data, client, mock_today_data
-    ):
+    def test_get_today_data_with_telegram_user_id(self, get_today, db_mocks, mock_today_data):
         """Test getting today data with real Telegram user ID from header."""
-        mock_db_get_today_data.return_value = mock_today_data
+        db_mocks.today.return_value = mock_today_data
 
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/today/2025-09-28", headers=headers)
+        response = get_today()
 
         assert response.status_code == 200
         data = response.json()
         assert data == mock_today_data
 
         # Verify that db_get_today_data was called with the correct parameters
-        mock_db_get_today_data.assert_called_once_with("2025-09-28", "59357664")
+        db_mocks.today.assert_awaited_once_with("2025-09-28", "59357664")
 
-    def test_get_today_data_without_user_id_header(self, client):
+    def test_get_today_data_without_user_id_header(self, get_today):
         """Test getting today data without x-user-id header returns 401."""
-        response = client.get("/today/2025-09-28")
+        response = get_today(headers=None)
 
         assert response.status_code == 401
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_today_data")
-    def test_get_today_data_database_error(self, mock_db_get_today_data, client):
+    def test_get_today_data_database_error(self, get_today, db_mocks):
         """Test getting today data when database error occurs."""
-        mock_db_get_today_data.side_effect = Exception("Database connection failed")
+        db_mocks.today.side_effect = Exception("Database connection failed")
 
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/today/2025-09-28", headers=headers)
+        response = get_today()
 
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
 
-    @patch("calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary")
-    def test_invalid_date_format(self, mock_db_get_daily_summary, client):
+    def test_invalid_date_format(self, get_summary, db_mocks):
         """Test getting daily summary with invalid date format."""
-        mock_db_get_daily_summary.side_effect = Exception("Invalid date format")
-        headers = {"x-user-id": "59357664"}
-        response = client.get("/daily-summary/invalid-date", headers=headers)
+        db_mocks.summary.side_effect = Exception("Invalid date format")
+        response = get_summary("invalid-date")
 
         assert response.status_code == 500
 
-    def test_empty_user_id_header(self, client):
+    def test_empty_user_id_header(self, get_summary):
         """Test getting daily summary with empty x-user-id header returns 401."""
-        headers = {"x-user-id": ""}
-        response = client.get("/daily-summary/2025-09-28", headers=headers)
+        response = get_summary(headers={"x-user-id": ""})
 
         assert response.status_code == 401
 
-    def test_user_id_with_whitespace(self, client):
-        """Test user ID with leading/trailing whitespace."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            headers = {"x-user-id": "  59357664  "}  # With whitespace
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the user ID as-is (including whitespace)
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", "  59357664  ")
-
-    def test_user_id_case_sensitivity(self, client):
-        """Test that x-user-id header is case insensitive (FastAPI behavior)."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            # Test with different case - FastAPI treats headers as case-insensitive
-            headers = {"X-User-ID": "59357664"}  # Different case
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the user ID since FastAPI is case-insensitive
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", "59357664")
-
-    def test_multiple_user_id_headers(self, client):
-        """Test behavior with multiple x-user-id headers (HTTP spec behavior)."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            # HTTP headers with same name are concatenated with commas
-            # FastAPI will use the first value
-            headers = {"x-user-id": "59357664,99999999"}  # Comma-separated values
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the full comma-separated value
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", "59357664,99999999")
-
-    def test_special_characters_in_user_id(self, client):
-        """Test user ID with special characters (should still be passed as is)."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            special_id = "user-!@#$%-id"
-            headers = {"x-user-id": special_id}
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", special_id)
-
-    def test_very_long_user_id(self, client):
-        """Test user ID with very long string."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            long_user_id = "a" * 1000  # Very long user ID
-            headers = {"x-user-id": long_user_id}
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the user ID as-is
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", long_user_id)
-
-    def test_numeric_user_id(self, client):
-        """Test user ID that is purely numeric."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            headers = {"x-user-id": "123456789"}
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the user ID as-is
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", "123456789")
-
-    def test_uuid_user_id(self, client):
-        """Test user ID that is a UUID."""
-        with patch(
-            "calorie_track_ai_bot.api.v1.daily_summary.db_get_daily_summary"
-        ) as mock_db_get_daily_summary:
-            mock_db_get_daily_summary.return_value = None
-
-            uuid_user_id = "550e8400-e29b-41d4-a716-446655440000"
-            headers = {"x-user-id": uuid_user_id}
-            response = client.get("/daily-summary/2025-09-28", headers=headers)
-
-            assert response.status_code == 200
-            # Should use the user ID as-is
-            mock_db_get_daily_summary.assert_called_once_with("2025-09-28", uuid_user_id)
+    @pytest.mark.parametrize(
+        ("header_key", "user_id"),
+        [
+            pytest.param("x-user-id", "  59357664  ", id="whitespace"),
+            pytest.param("X-User-ID", "59357664", id="header_case_insensitive"),
+            pytest.param("x-user-id", "59357664,99999999", id="comma_separated"),
+            pytest.param("x-user-id", "user-!@#$%-id", id="special_characters"),
+            pytest.param("x-user-id", "a" * 1000, id="very_long"),
+            pytest.param("x-user-id", "123456789", id="numeric"),
+            pytest.param("x-user-id", "550e8400-e29b-41d4-a716-446655440000", id="uuid"),
+        ],
+    )
+    def test_user_id_passthrough(self, get_summary, db_mocks, header_key, user_id):
+        """Test that the x-user-id header value reaches the database call as-is."""
+        db_mocks.summary.return_value = None
+
+        response = get_summary(headers={header_key: user_id})
+
+        assert response.status_code == 200
+        db_mocks.summary.assert_awaited_once_with("2025-09-28", user_id)
@@ -1,48 +1,99 @@
 """Tests for development environment endpoint."""
 
 import uuid
+from datetime import datetime
 
-from fastapi.testclient import TestClient
+import pytest
 
-from src.calorie_track_ai_bot.main import app
-from src.calorie_track_ai_bot.schemas import DevelopmentEnvironment
+from calorie_track_ai_bot.schemas import DevelopmentEnvironment
 
-client = TestClient(app)
+pytestmark = pytest.mark.api_contract
 
-HEADERS = {"x-user-id": "123456789"}
+requires_dev_endpoints = pytest.mark.usefixtures("_dev_endpoints_enabled")
 
 
-class TestDevEnvironmentContract:
-    def test_get_dev_environment_success(self):
-        response = client.get("/api/v1/dev/environment", headers=HEADERS)
+@pytest.fixture(scope="module")
+def _dev_endpoints_enabled(client, auth_headers):
+    """Probe the dev endpoints once; skip dependent tests if the app refuses them."""
+    response = client.get("/api/v1/dev/environment", headers=auth_headers)
+    if response.status_code == 403:
+        pytest.skip("development endpoints are disabled")
 
-        if response.status_code == 403:
-            assert response.json()["error"] == "access_denied"
-            return
 
-        assert response.status_code == 200
-        data = response.json()
+@pytest.fixture(scope="class")
+def dev_env_response(client, auth_headers):
+    """One authenticated GET shared by the class, with the parsed model on 200."""
+    response = client.get("/api/v1/dev/environment", headers=auth_headers)
+    model = DevelopmentEnvironment(**response.json()) if response.status_code == 200 else None
+    return response, model
+
+
+@pytest.fixture(scope="class")
+def db_status_data(client, auth_headers, class_db_pool):
+    """One authenticated GET shared by the class, parsed once."""
+    response = client.get("/api/v1/dev/db/status", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestDevEnvironmentContract:
+    @requires_dev_endpoints
+    def test_get_dev_environment_success(self, dev_env_response):
+        response, dev_env = dev_env_response
 
-        dev_env = DevelopmentEnvironment(**data)
+        assert response.status_code == 200
         assert isinstance(dev_env.id, uuid.UUID)
         assert len(dev_env.name) > 0
         assert 1024 <= dev_env.frontend_port <= 65535
         assert 1024 <= dev_env.backend_port <= 65535
         assert dev_env.frontend_port != dev_env.backend_port
 
-    def test_get_dev_environment_stable_id(self):
-        response1 = client.get("/api/v1/dev/environment", headers=HEADERS)
-
-        if response1.status_code == 403:
-            return
+    @requires_dev_endpoints
+    def test_get_dev_environment_stable_id(self, client, auth_headers, dev_env_response):
+        response1, dev_env = dev_env_response
 
         assert response1.status_code == 200
 
-        response2 = client.get("/api/v1/dev/environment", headers=HEADERS)
+        response2 = client.get("/api/v1/dev/environment", headers=auth_headers)
         assert response2.status_code == 200
 
-        assert response1.json()["id"] == response2.json()["id"]
+        assert str(dev_env.id) == response2.json()["id"]
 
-    def test_get_dev_environment_requires_authentication(self):
+    def test_get_dev_environment_requires_authentication(self, client):
         response = client.get("/api/v1/dev/environment")
         assert response.status_code == 401
+
+    @requires_dev_endpoints
+    @pytest.mark.benchmark
+    def test_get_dev_environment_performance_requirement(self, client, auth_headers, benchmark):
+        response = benchmark.pedantic(
+            client.get,
+            args=("/api/v1/dev/environment",),
+            kwargs={"headers": auth_headers},
+            rounds=50,
+            warmup_rounds=5,
+        )
+
+        assert response.status_code == 200
+        median_ms = benchmark.stats.stats.median * 1000
+        assert median_ms < 200, f"Median response time was {median_ms:.2f}ms, expected < 200ms"
+
+
+@pytest.mark.usefixtures("class_db_pool")
+class TestDevDbStatusContract:
+    @requires_dev_endpoints
+    @pytest.mark.parametrize(
+        ("field", "check"),
+        [
+            ("status", lambda value: value == "running"),
+            ("database_url", lambda value: value.startswith("postgresql://")),
+            ("last_check", datetime.fromisoformat),
+        ],
+        ids=["status", "database_url", "last_check"],
+    )
+    def test_get_db_status_field(self, db_status_data, field, check):
+        assert check(db_status_data[field])
+
+    def test_get_db_status_requires_authentication(self, client):
+        response = client.get("/api/v1/dev/db/status")
+        assert response.status_code == 401
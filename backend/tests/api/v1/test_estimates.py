@@ -1,29 +1,57 @@
 """Tests for estimates API endpoints."""
 
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
 
 from calorie_track_ai_bot.api.v1.estimates import router
 
+pytestmark = pytest.mark.api_contract
+
+_ESTIMATE_TEMPLATE = {
+    "id": "estimate123",
+    "photo_id": "photo123",
+    "kcal_mean": 300,
+    "kcal_min": 250,
+    "kcal_max": 350,
+    "confidence": 0.7,
+    "breakdown": [],
+    "status": "done",
+}
+
+
+@pytest.fixture(scope="module")
+def client(router_client):
+    """Test client for the estimates router."""
+    with router_client(router) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def _module_mocks():
+    """Patch the queue and DB calls once for the whole module."""
+    mocks = SimpleNamespace(enqueue=AsyncMock(), db_get=AsyncMock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job", mocks.enqueue)
+        mp.setattr("calorie_track_ai_bot.api.v1.estimates.db_get_estimate", mocks.db_get)
+        yield mocks
 
-class TestEstimatesEndpoints:
-    """Test estimate-related endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from fastapi import FastAPI
+@pytest.fixture(autouse=True)
+def mocks(_module_mocks):
+    """Module mocks with return values and side effects cleared for each test."""
+    for mock in vars(_module_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _module_mocks
 
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job")
-    def test_estimate_photo_success(self, mock_enqueue, client):
+class TestEstimatesEndpoints:
+    """Test estimate-related endpoints."""
+
+    def test_estimate_photo_success(self, mocks, client):
         """Test successful photo estimation request."""
-        mock_enqueue.return_value = "photo123"
+        mocks.enqueue.return_value = "photo123"
 
         response = client.post("/photos/photo123/estimate")
 
@@ -38,49 +66,31 @@ class TestEstimatesEndpoints:
         assert data["estimate_id"] == "photo123"
         assert data["status"] == "queued"
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job")
-    def test_estimate_photo_different_ids(self, mock_enqueue, client):
+    @pytest.mark.parametrize(
+        "photo_id",
+        ["photo123", "photo456", "550e8400-e29b-41d4-a716-446655440000", "test-photo-789"],
+    )
+    def test_estimate_photo_different_ids(self, mocks, client, photo_id):
         """Test photo estimation with different photo IDs."""
-        test_cases = [
-            "photo123",
-            "photo456",
-            "550e8400-e29b-41d4-a716-446655440000",
-            "test-photo-789",
-        ]
+        mocks.enqueue.return_value = photo_id
 
-        for photo_id in test_cases:
-            mock_enqueue.return_value = photo_id
+        response = client.post(f"/photos/{photo_id}/estimate")
 
-            response = client.post(f"/photos/{photo_id}/estimate")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["estimate_id"] == photo_id
-            assert data["status"] == "queued"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["estimate_id"] == photo_id
+        assert data["status"] == "queued"
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job")
-    def test_estimate_photo_queue_error(self, mock_enqueue, client):
+    def test_estimate_photo_queue_error(self, mocks, client):
         """Test photo estimation when queue operation fails."""
-        mock_enqueue.side_effect = Exception("Queue Error")
+        mocks.enqueue.side_effect = Exception("Queue Error")
 
         response = client.post("/photos/photo123/estimate")
 
         # Should propagate the error
         assert response.status_code == 500
 
-    def test_estimate_photo_methods(self, client):
-        """Test that estimate photo only accepts POST requests."""
-        get_response = client.get("/photos/photo123/estimate")
-        assert get_response.status_code == 405  # Method Not Allowed
-
-        put_response = client.put("/photos/photo123/estimate")
-        assert put_response.status_code == 405
-
-        delete_response = client.delete("/photos/photo123/estimate")
-        assert delete_response.status_code == 405
-
-    @patch("calorie_track_ai_bot.api.v1.estimates.db_get_estimate")
-    def test_get_estimate_success(self, mock_db_get, client):
+    def test_get_estimate_success(self, mocks, client):
         """Test successful estimate retrieval."""
         estimate_data = {
             "id": "estimate123",
@@ -92,7 +102,7 @@ class TestEstimatesEndpoints:
             "breakdown": [{"label": "pizza", "kcal": 500, "confidence": 0.8}],
             "status": "done",
         }
-        mock_db_get.return_value = estimate_data
+        mocks.db_get.return_value = estimate_data
 
         response = client.get("/estimates/estimate123")
 
@@ -100,10 +110,9 @@ class TestEstimatesEndpoints:
         data = response.json()
         assert data == estimate_data
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.db_get_estimate")
-    def test_get_estimate_not_found(self, mock_db_get, client):
+    def test_get_estimate_not_found(self, mocks, client):
         """Test estimate retrieval when estimate doesn't exist."""
-        mock_db_get.return_value = None
+        mocks.db_get.return_value = None
 
         response = client.get("/estimates/nonexistent")
 
@@ -111,87 +120,62 @@ class TestEstimatesEndpoints:
         data = response.json()
         assert data["detail"] == "Not found"
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.db_get_estimate")
-    def test_get_estimate_db_error(self, mock_db_get, client):
+    def test_get_estimate_db_error(self, mocks, client):
         """Test estimate retrieval when database operation fails."""
-        mock_db_get.side_effect = Exception("Database Error")
+        mocks.db_get.side_effect = Exception("Database Error")
 
         response = client.get("/estimates/estimate123")
 
         # Should propagate the error
         assert response.status_code == 500
 
-    def test_get_estimate_methods(self, client):
-        """Test that get estimate only accepts GET requests."""
-        post_response = client.post("/estimates/estimate123")
-        assert post_response.status_code == 405  # Method Not Allowed
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("get", "/photos/photo123/estimate"),
+            ("put", "/photos/photo123/estimate"),
+            ("delete", "/photos/photo123/estimate"),
+            ("post", "/estimates/estimate123"),
+            ("put", "/estimates/estimate123"),
+            ("delete", "/estimates/estimate123"),
+        ],
+    )
+    def test_estimate_method_not_allowed(self, client, method, path):
+        """Test that each estimate endpoint rejects the other HTTP methods."""
+        response = client.request(method, path)
+        assert response.status_code == 405  # Method Not Allowed
+
+    @pytest.mark.parametrize(
+        "estimate_id",
+        ["estimate123", "estimate456", "550e8400-e29b-41d4-a716-446655440000", "test-estimate-789"],
+    )
+    def test_get_estimate_different_ids(self, mocks, client, estimate_id):
+        """Test estimate retrieval with different estimate IDs."""
+        mocks.db_get.return_value = _ESTIMATE_TEMPLATE | {"id": estimate_id}
 
-        put_response = client.put("/estimates/estimate123")
-        assert put_response.status_code == 405
+        response = client.get(f"/estimates/{estimate_id}")
 
-        delete_response = client.delete("/estimates/estimate123")
-        assert delete_response.status_code == 405
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == estimate_id
 
-    @patch("calorie_track_ai_bot.api.v1.estimates.db_get_estimate")
-    def test_get_estimate_different_ids(self, mock_db_get, client):
-        """Test estimate retrieval with different estimate IDs."""
-        test_cases = [
-            "estimate123",
-            "estimate456",
-            "550e8400-e29b-41d4-a716-446655440000",
-            "test-estimate-789",
-        ]
-
-        for estimate_id in test_cases:
-            estimate_data = {
-                "id": estimate_id,
-                "photo_id": "photo123",
-                "kcal_mean": 300,
-                "kcal_min": 250,
-                "kcal_max": 350,
-                "confidence": 0.7,
-                "breakdown": [],
-                "status": "done",
-            }
-            mock_db_get.return_value = estimate_data
-
-            response = client.get(f"/estimates/{estimate_id}")
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["id"] == estimate_id
-
-    def test_estimate_endpoints_content_type(self, client):
+    def test_estimate_endpoints_content_type(self, mocks, client):
         """Test that estimate endpoints return JSON content type."""
-        with (
-            patch("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job") as mock_enqueue,
-            patch("calorie_track_ai_bot.api.v1.estimates.db_get_estimate") as mock_db_get,
-        ):
-            mock_enqueue.return_value = "photo123"
-
-            mock_db_get.return_value = {
-                "id": "estimate123",
-                "photo_id": "photo123",
-                "kcal_mean": 300,
-                "kcal_min": 250,
-                "kcal_max": 350,
-                "confidence": 0.7,
-                "breakdown": [],
-                "status": "done",
-            }
-
-            # Test POST endpoint
-            post_response = client.post("/photos/photo123/estimate")
-            assert post_response.headers["content-type"] == "application/json"
-
-            # Test GET endpoint
-            get_response = client.get("/estimates/estimate123")
-            assert get_response.headers["content-type"] == "application/json"
-
-    @patch("calorie_track_ai_bot.api.v1.estimates.enqueue_estimate_job")
-    def test_estimate_photo_response_structure(self, mock_enqueue, client):
+        mocks.enqueue.return_value = "photo123"
+
+        mocks.db_get.return_value = _ESTIMATE_TEMPLATE
+
+        # Test POST endpoint
+        post_response = client.post("/photos/photo123/estimate")
+        assert post_response.headers["content-type"] == "application/json"
+
+        # Test GET endpoint
+        get_response = client.get("/estimates/estimate123")
+        assert get_response.headers["content-type"] == "application/json"
+
+    def test_estimate_photo_response_structure(self, mocks, client):
         """Test that estimate photo returns consistent response structure."""
-        mock_enqueue.return_value = "photo123"
+        mocks.enqueue.return_value = "photo123"
 
         response = client.post("/photos/photo123/estimate")
         data = response.json()
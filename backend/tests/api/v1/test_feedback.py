@@ -6,338 +6,255 @@ Tests cover feedback submission, validation, and error handling.
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
-from fastapi.testclient import TestClient
+import orjson
+import pytest
 
-from src.calorie_track_ai_bot.main import app
-from src.calorie_track_ai_bot.schemas import (
+from calorie_track_ai_bot.schemas import (
     FeedbackMessageType,
     FeedbackStatus,
     FeedbackSubmission,
     FeedbackSubmissionResponse,
 )
 
-client = TestClient(app)
+pytestmark = pytest.mark.api_contract
+
+_MESSAGE_TYPES = ("feedback", "bug", "question", "support")
+
+# Request bodies are serialized once and posted as raw JSON content.
+_VALID_BODY = orjson.dumps(
+    {
+        "message_type": "feedback",
+        "message_content": "Great app! Love the calorie tracking feature.",
+        "user_context": {
+            "page": "/feedback",
+            "user_agent": "Mozilla/5.0",
+            "app_version": "0.1.0",
+            "language": "en",
+        },
+    }
+)
+_FEEDBACK_BODY = orjson.dumps({"message_type": "feedback", "message_content": "Test feedback"})
+_TYPED_BODIES = {
+    message_type: orjson.dumps(
+        {"message_type": message_type, "message_content": f"Test {message_type} message"}
+    )
+    for message_type in _MESSAGE_TYPES
+}
+_INVALID_TYPE_BODY = orjson.dumps({"message_type": "other", "message_content": "Test feedback"})
+_EMPTY_BODY = orjson.dumps({"message_type": "feedback", "message_content": ""})
+_TOO_LONG_BODY = orjson.dumps({"message_type": "feedback", "message_content": "x" * 5001})
+_MAX_LENGTH_BODY = orjson.dumps({"message_type": "feedback", "message_content": "x" * 5000})
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_INVALID_USER_HEADERS = {"x-user-id": "invalid_user", "content-type": "application/json"}
+
+
+def _async_return(value):
+    """A bare coroutine stub; cheaper to await than an AsyncMock."""
+
+    async def _stub(*args, **kwargs):
+        return value
+
+    return _stub
+
+
+@pytest.fixture(scope="module")
+def _module_mocks():
+    """Patch the feedback service and user lookup once for the whole module."""
+    service = Mock()
+    mocks = SimpleNamespace(service=service, resolve=AsyncMock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "calorie_track_ai_bot.api.v1.feedback.get_feedback_service",
+            Mock(return_value=service),
+        )
+        mp.setattr("calorie_track_ai_bot.api.v1.deps.resolve_user_id", mocks.resolve)
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def mocks(_module_mocks):
+    """Module mocks with stubs and return values cleared for each test."""
+    _module_mocks.resolve.reset_mock(return_value=True, side_effect=True)
+    _module_mocks.service.submit_feedback = _async_return(None)
+    _module_mocks.service.get_feedback = _async_return(None)
+    return _module_mocks
+
+
+# Fixed ids and timestamps; tests only check that they round-trip.
+_FAKE_ID = uuid.UUID(int=0)
+_FAKE_USER_ID = str(uuid.UUID(int=1))
+_FAKE_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+_SUBMITTED = FeedbackSubmissionResponse(
+    id=_FAKE_ID,
+    status=FeedbackStatus.new,
+    created_at=_FAKE_TS,
+    message="Thank you!",
+)
+
+_STORED = FeedbackSubmission(
+    id=_FAKE_ID,
+    user_id=_FAKE_USER_ID,
+    message_type=FeedbackMessageType.feedback,
+    message_content="Test feedback",
+    user_context={"page": "/feedback"},
+    status=FeedbackStatus.new,
+    admin_notes=None,
+    created_at=_FAKE_TS,
+    updated_at=_FAKE_TS,
+)
 
 
 class TestFeedbackSubmissionContract:
     """Test feedback submission API contracts."""
 
-    def test_submit_feedback_with_valid_data_returns_201(self):
+    def test_submit_feedback_with_valid_data_returns_201(self, client, mocks, json_auth_headers):
         """Test that POST /api/v1/feedback returns 201 with valid feedback data."""
-        with (
-            patch(
-                "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-            ) as mock_get_service,
-            patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-        ):
-            # Setup mocks
-            mock_user_id = str(uuid.uuid4())
-            mock_resolve.return_value = mock_user_id
-
-            feedback_id = uuid.uuid4()
-            created_at = datetime.now(UTC)
-            mock_service = Mock()
-            mock_service.submit_feedback = AsyncMock(
-                return_value=FeedbackSubmissionResponse(
-                    id=feedback_id,
-                    status=FeedbackStatus.new,
-                    created_at=created_at,
-                    message="Thank you! We received your feedback.",
-                )
-            )
-            mock_get_service.return_value = mock_service
-
-            # Valid feedback data
-            feedback_data = {
-                "message_type": "feedback",
-                "message_content": "Great app! Love the calorie tracking feature.",
-                "user_context": {
-                    "page": "/feedback",
-                    "user_agent": "Mozilla/5.0",
-                    "app_version": "0.1.0",
-                    "language": "en",
-                },
-            }
-
-            # Make request with required headers
-            response = client.post(
-                "/api/v1/feedback",
-                json=feedback_data,
-                headers={"x-user-id": "123456789"},
-            )
-
-            assert response.status_code == 201
-            data = response.json()
-
-            # Validate response against FeedbackSubmissionResponse schema
-            feedback_response = FeedbackSubmissionResponse(**data)
-            assert str(feedback_response.id) == str(feedback_id)
-            assert feedback_response.status == FeedbackStatus.new
-            assert feedback_response.message == "Thank you! We received your feedback."
-            assert isinstance(feedback_response.created_at, datetime)
-
-    def test_submit_feedback_without_auth_returns_401(self):
-        """Test that feedback submission without x-user-id header returns 401."""
-        feedback_data = {
-            "message_type": "feedback",
-            "message_content": "Test feedback",
-        }
+        mocks.resolve.return_value = _FAKE_USER_ID
+        submitted = _SUBMITTED.model_copy(
+            update={"message": "Thank you! We received your feedback."}
+        )
+        mocks.service.submit_feedback = _async_return(submitted)
+
+        response = client.post("/api/v1/feedback", content=_VALID_BODY, headers=json_auth_headers)
 
+        assert response.status_code == 201
+        data = response.json()
+
+        # The server already validated the response model; check the raw payload
+        assert data["id"] == str(submitted.id)
+        assert data["status"] == FeedbackStatus.new.value
+        assert data["message"] == "Thank you! We received your feedback."
+        datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
+
+    def test_submit_feedback_without_auth_returns_401(self, client):
+        """Test that feedback submission without x-user-id header returns 401."""
         # Request without x-user-id header
-        response = client.post("/api/v1/feedback", json=feedback_data)
+        response = client.post(
+            "/api/v1/feedback",
+            content=_FEEDBACK_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 401
         assert "x-user-id" in response.json()["detail"].lower()
 
-    def test_submit_feedback_validates_message_type(self):
+    def test_submit_feedback_validates_message_type(self, client, json_auth_headers):
         """Test that invalid message_type is rejected."""
-        invalid_feedback_data = {
-            "message_type": "other",  # Invalid type (not in enum)
-            "message_content": "Test feedback",
-        }
-
         response = client.post(
-            "/api/v1/feedback",
-            json=invalid_feedback_data,
-            headers={"x-user-id": "123456789"},
+            "/api/v1/feedback", content=_INVALID_TYPE_BODY, headers=json_auth_headers
         )
 
         # Should return 422 for invalid enum value (Pydantic validation error)
         assert response.status_code == 422
-        assert "message_type" in str(response.json()).lower()
+        assert any("message_type" in err["loc"] for err in response.json()["detail"])
 
-    def test_submit_feedback_validates_message_types(self):
+    @pytest.mark.parametrize("message_type", _MESSAGE_TYPES)
+    def test_submit_feedback_validates_message_types(
+        self, client, mocks, json_auth_headers, message_type
+    ):
         """Test that all valid message types are accepted."""
-        valid_types = ["feedback", "bug", "question", "support"]
-
-        for message_type in valid_types:
-            with (
-                patch(
-                    "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-                ) as mock_get_service,
-                patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-            ):
-                mock_resolve.return_value = str(uuid.uuid4())
-                mock_service = Mock()
-                mock_service.submit_feedback = AsyncMock(
-                    return_value=FeedbackSubmissionResponse(
-                        id=uuid.uuid4(),
-                        status=FeedbackStatus.new,
-                        created_at=datetime.now(UTC),
-                        message="Thank you!",
-                    )
-                )
-                mock_get_service.return_value = mock_service
-
-                feedback_data = {
-                    "message_type": message_type,
-                    "message_content": f"Test {message_type} message",
-                }
-
-                response = client.post(
-                    "/api/v1/feedback",
-                    json=feedback_data,
-                    headers={"x-user-id": "123456789"},
-                )
-
-                assert response.status_code == 201, f"Failed for type: {message_type}"
-
-    def test_submit_feedback_validates_empty_message(self):
-        """Test that empty message_content is rejected."""
-        invalid_feedback_data = {
-            "message_type": "feedback",
-            "message_content": "",  # Empty message
-        }
+        mocks.resolve.return_value = _FAKE_USER_ID
+        mocks.service.submit_feedback = _async_return(_SUBMITTED)
 
         response = client.post(
-            "/api/v1/feedback",
-            json=invalid_feedback_data,
-            headers={"x-user-id": "123456789"},
+            "/api/v1/feedback", content=_TYPED_BODIES[message_type], headers=json_auth_headers
         )
 
+        assert response.status_code == 201
+
+    def test_submit_feedback_validates_empty_message(self, client, json_auth_headers):
+        """Test that empty message_content is rejected."""
+        response = client.post("/api/v1/feedback", content=_EMPTY_BODY, headers=json_auth_headers)
+
         assert response.status_code == 422
-        assert "message_content" in str(response.json()).lower()
+        assert any("message_content" in err["loc"] for err in response.json()["detail"])
 
-    def test_submit_feedback_validates_message_length(self):
+    def test_submit_feedback_validates_message_length(self, client, json_auth_headers):
         """Test that message_content length validation works."""
         # Message exceeding 5000 characters
-        long_message = "x" * 5001
-
-        invalid_feedback_data = {
-            "message_type": "feedback",
-            "message_content": long_message,
-        }
-
         response = client.post(
-            "/api/v1/feedback",
-            json=invalid_feedback_data,
-            headers={"x-user-id": "123456789"},
+            "/api/v1/feedback", content=_TOO_LONG_BODY, headers=json_auth_headers
         )
 
         assert response.status_code == 422
-        assert "message_content" in str(response.json()).lower()
+        assert any("message_content" in err["loc"] for err in response.json()["detail"])
 
-    def test_submit_feedback_accepts_max_length_message(self):
+    def test_submit_feedback_accepts_max_length_message(self, client, mocks, json_auth_headers):
         """Test that message at maximum length (5000 chars) is accepted."""
-        max_length_message = "x" * 5000
-
-        with (
-            patch(
-                "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-            ) as mock_get_service,
-            patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-        ):
-            mock_resolve.return_value = str(uuid.uuid4())
-            mock_service = Mock()
-            mock_service.submit_feedback = AsyncMock(
-                return_value=FeedbackSubmissionResponse(
-                    id=uuid.uuid4(),
-                    status=FeedbackStatus.new,
-                    created_at=datetime.now(UTC),
-                    message="Thank you!",
-                )
-            )
-            mock_get_service.return_value = mock_service
-
-            feedback_data = {
-                "message_type": "feedback",
-                "message_content": max_length_message,
-            }
-
-            response = client.post(
-                "/api/v1/feedback",
-                json=feedback_data,
-                headers={"x-user-id": "123456789"},
-            )
-
-            assert response.status_code == 201
-
-    def test_submit_feedback_with_user_context(self):
+        mocks.resolve.return_value = _FAKE_USER_ID
+        mocks.service.submit_feedback = _async_return(_SUBMITTED)
+
+        response = client.post(
+            "/api/v1/feedback", content=_MAX_LENGTH_BODY, headers=json_auth_headers
+        )
+
+        assert response.status_code == 201
+
+    def test_submit_feedback_with_user_context(self, client, mocks, json_auth_headers):
         """Test that user_context is optional and properly handled."""
-        with (
-            patch(
-                "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-            ) as mock_get_service,
-            patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-        ):
-            mock_resolve.return_value = str(uuid.uuid4())
-            mock_service = Mock()
-            mock_service.submit_feedback = AsyncMock(
-                return_value=FeedbackSubmissionResponse(
-                    id=uuid.uuid4(),
-                    status=FeedbackStatus.new,
-                    created_at=datetime.now(UTC),
-                    message="Thank you!",
-                )
-            )
-            mock_get_service.return_value = mock_service
-
-            # Test without user_context
-            feedback_data = {
-                "message_type": "feedback",
-                "message_content": "Test message",
-            }
-
-            response = client.post(
-                "/api/v1/feedback",
-                json=feedback_data,
-                headers={"x-user-id": "123456789"},
-            )
-
-            assert response.status_code == 201
-
-    def test_submit_feedback_with_invalid_user_returns_404(self):
-        """Test that feedback submission with invalid user ID returns 404."""
-        with patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve:
-            mock_resolve.return_value = None  # User not found
+        mocks.resolve.return_value = _FAKE_USER_ID
+        mocks.service.submit_feedback = _async_return(_SUBMITTED)
 
-            feedback_data = {
-                "message_type": "feedback",
-                "message_content": "Test message",
-            }
+        # Test without user_context
+        response = client.post(
+            "/api/v1/feedback", content=_FEEDBACK_BODY, headers=json_auth_headers
+        )
 
-            response = client.post(
-                "/api/v1/feedback",
-                json=feedback_data,
-                headers={"x-user-id": "invalid_user"},
-            )
+        assert response.status_code == 201
 
-            assert response.status_code == 404
-            assert "user not found" in response.json()["detail"].lower()
+    def test_submit_feedback_with_invalid_user_returns_404(self, client, mocks):
+        """Test that feedback submission with invalid user ID returns 404."""
+        mocks.resolve.return_value = None  # User not found
+
+        response = client.post(
+            "/api/v1/feedback",
+            content=_FEEDBACK_BODY,
+            headers=_INVALID_USER_HEADERS,
+        )
+
+        assert response.status_code == 404
+        assert "user not found" in response.json()["detail"].lower()
 
 
 class TestFeedbackRetrievalContract:
     """Test feedback retrieval API contracts."""
 
-    def test_get_feedback_by_id_returns_200(self):
+    def test_get_feedback_by_id_returns_200(self, client, mocks, auth_headers):
         """Test that GET /api/v1/feedback/{id} returns 200 with valid feedback."""
-        with (
-            patch(
-                "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-            ) as mock_get_service,
-            patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-        ):
-            # Setup mocks
-            mock_user_id = str(uuid.uuid4())
-            mock_resolve.return_value = mock_user_id
-
-            feedback_id = uuid.uuid4()
-            created_at = datetime.now(UTC)
-            mock_service = Mock()
-            mock_service.get_feedback = AsyncMock(
-                return_value=FeedbackSubmission(
-                    id=feedback_id,
-                    user_id=mock_user_id,
-                    message_type=FeedbackMessageType.feedback,
-                    message_content="Test feedback",
-                    user_context={"page": "/feedback"},
-                    status=FeedbackStatus.new,
-                    admin_notes=None,
-                    created_at=created_at,
-                    updated_at=created_at,
-                )
-            )
-            mock_get_service.return_value = mock_service
-
-            response = client.get(
-                f"/api/v1/feedback/{feedback_id}", headers={"x-user-id": "123456789"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-
-            # Validate response
-            feedback = FeedbackSubmission(**data)
-            assert str(feedback.id) == str(feedback_id)
-            assert feedback.message_content == "Test feedback"
-            assert feedback.status == FeedbackStatus.new
-
-    def test_get_nonexistent_feedback_returns_404(self):
+        mocks.resolve.return_value = _FAKE_USER_ID
+        mocks.service.get_feedback = _async_return(_STORED)
+        feedback_id = _STORED.id
+
+        response = client.get(f"/api/v1/feedback/{feedback_id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+
+        # Validate response
+        feedback = FeedbackSubmission(**data)
+        assert str(feedback.id) == str(feedback_id)
+        assert feedback.message_content == "Test feedback"
+        assert feedback.status == FeedbackStatus.new
+
+    def test_get_nonexistent_feedback_returns_404(self, client, mocks, auth_headers):
         """Test that GET returns 404 for non-existent feedback."""
-        with (
-            patch(
-                "src.calorie_track_ai_bot.api.v1.feedback.get_feedback_service"
-            ) as mock_get_service,
-            patch("src.calorie_track_ai_bot.api.v1.deps.resolve_user_id") as mock_resolve,
-        ):
-            mock_resolve.return_value = str(uuid.uuid4())
-            mock_service = Mock()
-            mock_service.get_feedback = AsyncMock(return_value=None)
-            mock_get_service.return_value = mock_service
-
-            feedback_id = uuid.uuid4()
-            response = client.get(
-                f"/api/v1/feedback/{feedback_id}", headers={"x-user-id": "123456789"}
-            )
-
-            assert response.status_code == 404
-            assert "not found" in response.json()["detail"].lower()
-
-    def test_get_feedback_without_auth_returns_401(self):
+        mocks.resolve.return_value = _FAKE_USER_ID
+        mocks.service.get_feedback = _async_return(None)
+
+        feedback_id = _FAKE_ID
+        response = client.get(f"/api/v1/feedback/{feedback_id}", headers=auth_headers)
+
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
+
+    def test_get_feedback_without_auth_returns_401(self, client):
         """Test that GET without x-user-id header returns 401."""
-        feedback_id = uuid.uuid4()
+        feedback_id = _FAKE_ID
         response = client.get(f"/api/v1/feedback/{feedback_id}")
 
         assert response.status_code == 401
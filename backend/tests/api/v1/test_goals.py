@@ -1,54 +1,69 @@
 """Tests for goals API endpoints with user ID detection."""
 
-from unittest.mock import patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
 
+from calorie_track_ai_bot.api.v1 import goals
 from calorie_track_ai_bot.api.v1.goals import router
 
+pytestmark = pytest.mark.api_contract
 
-class TestGoalsEndpoints:
-    """Test goal-related endpoints with user ID detection."""
+_GOAL_DATA = MappingProxyType(
+    {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "user_id": "00000000-0000-0000-0000-000000000002",
+        "daily_kcal_target": 2000,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+)
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from fastapi import FastAPI
 
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
+@pytest.fixture(scope="module")
+def client(router_client):
+    """Test client for the goals router."""
+    with router_client(router) as test_client:
+        yield test_client
+
+
+class TestGoalsEndpoints:
+    """Test goal-related endpoints with user ID detection."""
 
     @pytest.fixture
-    def mock_goal_data(self):
-        """Sample goal data for testing."""
-        return {
-            "id": "00000000-0000-0000-0000-000000000001",
-            "user_id": "00000000-0000-0000-0000-000000000002",
-            "daily_kcal_target": 2000,
-            "created_at": "2024-01-01T00:00:00Z",
-            "updated_at": "2024-01-01T00:00:00Z",
-        }
-
-    @patch("calorie_track_ai_bot.api.v1.goals.db_get_goal")
-    def test_get_goal_with_telegram_user_id(self, mock_db_get_goal, client, mock_goal_data):
+    def db_mocks(self, monkeypatch):
+        """Replace the goal DB calls with AsyncMocks the tests configure."""
+        mocks = SimpleNamespace(get_goal=AsyncMock(), save_goal=AsyncMock())
+        monkeypatch.setattr(goals, "db_get_goal", mocks.get_goal)
+        monkeypatch.setattr(goals, "db_create_or_update_goal", mocks.save_goal)
+        return mocks
+
+    def test_get_goal_with_telegram_user_id(self, client, db_mocks):
         """Test getting goal with real Telegram user ID from header."""
-        mock_db_get_goal.return_value = mock_goal_data
+        db_mocks.get_goal.return_value = _GOAL_DATA
 
         headers = {"x-user-id": "59357664"}
         response = client.get("/goals", headers=headers)
 
         assert response.status_code == 200
         data = response.json()
-        assert data == mock_goal_data
+        assert data == _GOAL_DATA
 
         # Verify that db_get_goal was called with the correct user ID
-        mock_db_get_goal.assert_called_once_with("59357664")
-
-    def test_get_goal_without_user_id_header(self, client):
-        """Test getting goal without x-user-id header returns 401."""
-        response = client.get("/goals")
+        db_mocks.get_goal.assert_called_once_with("59357664")
+
+    @pytest.mark.parametrize(
+        ("method", "payload"),
+        [
+            ("get", None),
+            ("post", {"daily_kcal_target": 2000}),
+            ("patch", {"daily_kcal_target": 2500}),
+        ],
+    )
+    def test_goal_without_user_id_header(self, client, method, payload):
+        """Test that each goal endpoint returns 401 without the x-user-id header."""
+        response = client.request(method, "/goals", json=payload)
 
         assert response.status_code == 401
 
@@ -59,10 +74,9 @@ class TestGoalsEndpoints:
 
         assert response.status_code == 401
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_get_goal")
-    def test_get_goal_no_goal_found(self, mock_db_get_goal, client):
+    def test_get_goal_no_goal_found(self, client, db_mocks):
         """Test getting goal when no goal exists for user."""
-        mock_db_get_goal.return_value = None
+        db_mocks.get_goal.return_value = None
 
         headers = {"x-user-id": "59357664"}
         response = client.get("/goals", headers=headers)
@@ -70,12 +84,11 @@ class TestGoalsEndpoints:
         assert response.status_code == 200
         assert response.json() is None
 
-        mock_db_get_goal.assert_called_once_with("59357664")
+        db_mocks.get_goal.assert_called_once_with("59357664")
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_get_goal")
-    def test_get_goal_database_error(self, mock_db_get_goal, client):
+    def test_get_goal_database_error(self, client, db_mocks):
         """Test getting goal when database error occurs."""
-        mock_db_get_goal.side_effect = Exception("Database connection failed")
+        db_mocks.get_goal.side_effect = Exception("Database connection failed")
 
         headers = {"x-user-id": "59357664"}
         response = client.get("/goals", headers=headers)
@@ -83,20 +96,18 @@ class TestGoalsEndpoints:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_get_goal")
-    def test_get_goal_table_not_found(self, mock_db_get_goal, client):
+    def test_get_goal_table_not_found(self, client, db_mocks):
         """Test getting goal when table doesn't exist returns 500."""
-        mock_db_get_goal.side_effect = Exception("Could not find the table")
+        db_mocks.get_goal.side_effect = Exception("Could not find the table")
 
         headers = {"x-user-id": "59357664"}
         response = client.get("/goals", headers=headers)
 
         assert response.status_code == 500
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_create_goal_with_telegram_user_id(self, mock_db_create_goal, client, mock_goal_data):
+    def test_create_goal_with_telegram_user_id(self, client, db_mocks):
         """Test creating goal with real Telegram user ID from header."""
-        mock_db_create_goal.return_value = mock_goal_data
+        db_mocks.save_goal.return_value = _GOAL_DATA
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2000}
@@ -104,22 +115,14 @@ class TestGoalsEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert data == mock_goal_data
+        assert data == _GOAL_DATA
 
         # Verify that db_create_or_update_goal was called with the correct user ID
-        mock_db_create_goal.assert_called_once_with("59357664", 2000)
+        db_mocks.save_goal.assert_called_once_with("59357664", 2000)
 
-    def test_create_goal_without_user_id_header(self, client):
-        """Test creating goal without x-user-id header returns 401."""
-        payload = {"daily_kcal_target": 2000}
-        response = client.post("/goals", json=payload)
-
-        assert response.status_code == 401
-
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_create_goal_database_error(self, mock_db_create_goal, client):
+    def test_create_goal_database_error(self, client, db_mocks):
         """Test creating goal when database error occurs."""
-        mock_db_create_goal.side_effect = Exception("Database connection failed")
+        db_mocks.save_goal.side_effect = Exception("Database connection failed")
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2000}
@@ -128,10 +131,9 @@ class TestGoalsEndpoints:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_create_goal_table_not_found(self, mock_db_create_goal, client):
+    def test_create_goal_table_not_found(self, client, db_mocks):
         """Test creating goal when table doesn't exist returns 500."""
-        mock_db_create_goal.side_effect = Exception("Could not find the table")
+        db_mocks.save_goal.side_effect = Exception("Could not find the table")
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2000}
@@ -139,10 +141,9 @@ class TestGoalsEndpoints:
 
         assert response.status_code == 500
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_update_goal_with_telegram_user_id(self, mock_db_create_goal, client, mock_goal_data):
+    def test_update_goal_with_telegram_user_id(self, client, db_mocks):
         """Test updating goal with real Telegram user ID from header."""
-        mock_db_create_goal.return_value = mock_goal_data
+        db_mocks.save_goal.return_value = _GOAL_DATA
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2500}
@@ -150,22 +151,14 @@ class TestGoalsEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert data == mock_goal_data
+        assert data == _GOAL_DATA
 
         # Verify that db_create_or_update_goal was called with the correct user ID
-        mock_db_create_goal.assert_called_once_with("59357664", 2500)
-
-    def test_update_goal_without_user_id_header(self, client):
-        """Test updating goal without x-user-id header returns 401."""
-        payload = {"daily_kcal_target": 2500}
-        response = client.patch("/goals", json=payload)
-
-        assert response.status_code == 401
+        db_mocks.save_goal.assert_called_once_with("59357664", 2500)
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_update_goal_database_error(self, mock_db_create_goal, client):
+    def test_update_goal_database_error(self, client, db_mocks):
         """Test updating goal when database error occurs."""
-        mock_db_create_goal.side_effect = Exception("Database connection failed")
+        db_mocks.save_goal.side_effect = Exception("Database connection failed")
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2500}
@@ -174,10 +167,9 @@ class TestGoalsEndpoints:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_update_goal_table_not_found(self, mock_db_create_goal, client):
+    def test_update_goal_table_not_found(self, client, db_mocks):
         """Test updating goal when table doesn't exist returns 500."""
-        mock_db_create_goal.side_effect = Exception("Could not find the table")
+        db_mocks.save_goal.side_effect = Exception("Could not find the table")
 
         headers = {"x-user-id": "59357664"}
         payload = {"daily_kcal_target": 2500}
@@ -201,83 +193,59 @@ class TestGoalsEndpoints:
 
         assert response.status_code == 422  # Validation error
 
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_negative_daily_kcal_target(self, mock_db, client):
-        """Test creating goal with negative daily_kcal_target."""
-        mock_db.side_effect = Exception("Invalid kcal target")
-        headers = {"x-user-id": "59357664"}
-        payload = {"daily_kcal_target": -100}
-        response = client.post("/goals", json=payload, headers=headers)
-
-        assert response.status_code == 500
-
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_zero_daily_kcal_target(self, mock_db, client):
-        """Test creating goal with zero daily_kcal_target."""
-        mock_db.side_effect = Exception("Invalid kcal target")
-        headers = {"x-user-id": "59357664"}
-        payload = {"daily_kcal_target": 0}
-        response = client.post("/goals", json=payload, headers=headers)
-
-        assert response.status_code == 500
-
-    @patch("calorie_track_ai_bot.api.v1.goals.db_create_or_update_goal")
-    def test_very_large_daily_kcal_target(self, mock_db, client):
-        """Test creating goal with very large daily_kcal_target."""
-        mock_db.side_effect = Exception("Invalid kcal target")
+    @pytest.mark.parametrize("kcal", [-100, 0, 100000])
+    def test_out_of_range_daily_kcal_target(self, client, db_mocks, kcal):
+        """Test creating goal with a negative, zero or very large daily_kcal_target."""
+        db_mocks.save_goal.side_effect = Exception("Invalid kcal target")
         headers = {"x-user-id": "59357664"}
-        payload = {"daily_kcal_target": 100000}
+        payload = {"daily_kcal_target": kcal}
         response = client.post("/goals", json=payload, headers=headers)
 
         assert response.status_code == 500
 
-    def test_user_id_header_case_sensitivity(self, client):
+    def test_user_id_header_case_sensitivity(self, client, db_mocks):
         """Test that x-user-id header is case insensitive (FastAPI behavior)."""
-        with patch("calorie_track_ai_bot.api.v1.goals.db_get_goal") as mock_db_get_goal:
-            mock_db_get_goal.return_value = None
+        db_mocks.get_goal.return_value = None
 
-            # Test with different case - FastAPI treats headers as case-insensitive
-            headers = {"X-User-ID": "59357664"}  # Different case
-            response = client.get("/goals", headers=headers)
+        # Test with different case - FastAPI treats headers as case-insensitive
+        headers = {"X-User-ID": "59357664"}  # Different case
+        response = client.get("/goals", headers=headers)
 
-            assert response.status_code == 200
-            # Should use the user ID since FastAPI is case-insensitive
-            mock_db_get_goal.assert_called_once_with("59357664")
+        assert response.status_code == 200
+        # Should use the user ID since FastAPI is case-insensitive
+        db_mocks.get_goal.assert_called_once_with("59357664")
 
-    def test_multiple_user_id_headers(self, client):
+    def test_multiple_user_id_headers(self, client, db_mocks):
         """Test behavior with multiple x-user-id headers (HTTP spec behavior)."""
-        with patch("calorie_track_ai_bot.api.v1.goals.db_get_goal") as mock_db_get_goal:
-            mock_db_get_goal.return_value = None
+        db_mocks.get_goal.return_value = None
 
-            # HTTP headers with same name are concatenated with commas
-            # FastAPI will use the first value
-            headers = {"x-user-id": "59357664,99999999"}  # Comma-separated values
-            response = client.get("/goals", headers=headers)
+        # HTTP headers with same name are concatenated with commas
+        # FastAPI will use the first value
+        headers = {"x-user-id": "59357664,99999999"}  # Comma-separated values
+        response = client.get("/goals", headers=headers)
 
-            assert response.status_code == 200
-            # Should use the full comma-separated value
-            mock_db_get_goal.assert_called_once_with("59357664,99999999")
+        assert response.status_code == 200
+        # Should use the full comma-separated value
+        db_mocks.get_goal.assert_called_once_with("59357664,99999999")
 
-    def test_user_id_with_whitespace(self, client):
+    def test_user_id_with_whitespace(self, client, db_mocks):
         """Test user ID with leading/trailing whitespace."""
-        with patch("calorie_track_ai_bot.api.v1.goals.db_get_goal") as mock_db_get_goal:
-            mock_db_get_goal.return_value = None
+        db_mocks.get_goal.return_value = None
 
-            headers = {"x-user-id": "  59357664  "}  # With whitespace
-            response = client.get("/goals", headers=headers)
+        headers = {"x-user-id": "  59357664  "}  # With whitespace
+        response = client.get("/goals", headers=headers)
 
-            assert response.status_code == 200
-            # Should use the user ID as-is (including whitespace)
-            mock_db_get_goal.assert_called_once_with("  59357664  ")
+        assert response.status_code == 200
+        # Should use the user ID as-is (including whitespace)
+        db_mocks.get_goal.assert_called_once_with("  59357664  ")
 
-    def test_user_id_with_special_characters(self, client):
+    def test_user_id_with_special_characters(self, client, db_mocks):
         """Test user ID with special characters."""
-        with patch("calorie_track_ai_bot.api.v1.goals.db_get_goal") as mock_db_get_goal:
-            mock_db_get_goal.return_value = None
+        db_mocks.get_goal.return_value = None
 
-            headers = {"x-user-id": "user@domain.com"}
-            response = client.get("/goals", headers=headers)
+        headers = {"x-user-id": "user@domain.com"}
+        response = client.get("/goals", headers=headers)
 
-            assert response.status_code == 200
-            # Should use the user ID as-is
-            mock_db_get_goal.assert_called_once_with("user@domain.com")
+        assert response.status_code == 200
+        # Should use the user ID as-is
+        db_mocks.get_goal.assert_called_once_with("user@domain.com")
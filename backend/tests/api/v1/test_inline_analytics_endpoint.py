@@ -1,44 +1,46 @@
 from datetime import UTC, date, datetime
-from unittest.mock import AsyncMock, patch
-from uuid import uuid4
+from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
-from calorie_track_ai_bot.main import app
+from calorie_track_ai_bot.api.v1 import inline_analytics
 from calorie_track_ai_bot.schemas import InlineAnalyticsDaily, InlineChatType, InlineFailureReason
 
+pytestmark = pytest.mark.api_contract
+
+_SAMPLE = InlineAnalyticsDaily(
+    id=UUID(int=0),
+    date=date(2025, 1, 1),
+    chat_type=InlineChatType.group,
+    trigger_counts={"reply_mention": 3},
+    request_count=5,
+    success_count=4,
+    failure_count=1,
+    permission_block_count=2,
+    avg_ack_latency_ms=2500,
+    p95_result_latency_ms=9000,
+    accuracy_within_tolerance_pct=92.5,
+    failure_reasons=[InlineFailureReason(reason="processing_error", count=1)],
+    last_updated_at=datetime(2025, 1, 7, tzinfo=UTC),
+)
+_SAMPLE_FETCH = AsyncMock(return_value=[_SAMPLE])
+
 
 @pytest.fixture
-def client() -> TestClient:
-    return TestClient(app)
-
-
-def test_get_inline_summary(client: TestClient) -> None:
-    sample = InlineAnalyticsDaily(
-        id=uuid4(),
-        date=date(2025, 1, 1),
-        chat_type=InlineChatType.group,
-        trigger_counts={"reply_mention": 3},
-        request_count=5,
-        success_count=4,
-        failure_count=1,
-        permission_block_count=2,
-        avg_ack_latency_ms=2500,
-        p95_result_latency_ms=9000,
-        accuracy_within_tolerance_pct=92.5,
-        failure_reasons=[InlineFailureReason(reason="processing_error", count=1)],
-        last_updated_at=datetime.now(UTC),
-    )
+def sample_fetch(monkeypatch):
+    """Serve the shared sample from the analytics query; call records are reset afterwards."""
+    monkeypatch.setattr(inline_analytics, "db_fetch_inline_analytics", _SAMPLE_FETCH)
+    yield _SAMPLE_FETCH
+    _SAMPLE_FETCH.reset_mock()
 
-    with patch(
-        "calorie_track_ai_bot.api.v1.inline_analytics.db_fetch_inline_analytics",
-        new=AsyncMock(return_value=[sample]),
-    ) as mock_fetch:
-        response = client.get(
-            "/api/v1/analytics/inline-summary",
-            params={"range_start": "2025-01-01", "range_end": "2025-01-07", "chat_type": "group"},
-        )
+
+async def test_get_inline_summary(async_client: AsyncClient, sample_fetch: AsyncMock) -> None:
+    response = await async_client.get(
+        "/api/v1/analytics/inline-summary",
+        params={"range_start": "2025-01-01", "range_end": "2025-01-07", "chat_type": "group"},
+    )
 
     assert response.status_code == 200
     body = response.json()
@@ -52,4 +54,4 @@ def test_get_inline_summary(client: TestClient) -> None:
     assert bucket["trigger_counts"]["reply_mention"] == 3
     assert bucket["failure_reasons"][0]["reason"] == "processing_error"
 
-    mock_fetch.assert_awaited_once()
+    sample_fetch.assert_awaited_once()
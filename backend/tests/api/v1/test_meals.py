@@ -3,22 +3,21 @@
 from unittest.mock import patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from calorie_track_ai_bot.api.v1.meals import router
 
+pytestmark = pytest.mark.api_contract
 
-class TestMealsEndpoints:
-    """Test meal-related endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from fastapi import FastAPI
+@pytest.fixture(scope="module")
+def client(router_client):
+    """Test client for the meals router."""
+    with router_client(router) as test_client:
+        yield test_client
+
 
-        app = FastAPI()
-        app.include_router(router)
-        return TestClient(app)
+class TestMealsEndpoints:
+    """Test meal-related endpoints."""
 
     @patch("calorie_track_ai_bot.api.v1.meals.db_create_meal_from_manual")
     def test_create_meal_manual_success(self, mock_db_create, client):
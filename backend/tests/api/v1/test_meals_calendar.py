@@ -5,6 +5,8 @@ from unittest.mock import patch
 
 import pytest
 
+pytestmark = pytest.mark.api_contract
+
 
 @pytest.mark.asyncio
 async def test_get_meals_calendar_success(
@@ -167,7 +169,8 @@ async def test_calendar_max_one_year_range(api_client, authenticated_headers, mo
         )
 
     assert response.status_code == 400
-    assert "1 year" in response.json()["detail"].lower() or "365" in response.json()["detail"]
+    detail = response.json()["detail"]
+    assert "1 year" in detail.lower() or "365" in detail
 
 
 @pytest.mark.asyncio
@@ -208,7 +211,8 @@ async def test_calendar_filters_one_year_retention(
         )
 
     assert response.status_code == 400
-    assert "1 year" in response.json()["detail"].lower() or "365" in response.json()["detail"]
+    detail = response.json()["detail"]
+    assert "1 year" in detail.lower() or "365" in detail
 
 
 @pytest.mark.asyncio
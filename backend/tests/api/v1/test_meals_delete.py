@@ -4,17 +4,20 @@ Feature: 003-update-logic-for
 Task: T008
 """
 
+from datetime import UTC, datetime
 from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
+pytestmark = pytest.mark.api_contract
+
 
 class TestMealsDeleteEndpoint:
     """Test meal deletion API contract"""
 
     def test_delete_meal_success(self, api_client, authenticated_headers, mock_db_pool):
         """Should delete meal and return 204 No Content"""
-        from datetime import UTC, datetime
-
         from calorie_track_ai_bot.schemas import Macronutrients, MealWithPhotos
 
         meal_id = str(uuid4())
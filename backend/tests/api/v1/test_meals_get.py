@@ -6,6 +6,8 @@ from uuid import uuid4
 
 import pytest
 
+pytestmark = pytest.mark.api_contract
+
 
 @pytest.mark.asyncio
 async def test_get_meal_by_id_success(
@@ -4,7 +4,7 @@ Feature: 003-update-logic-for
 Task: T007
 """
 
-from datetime import UTC
+from datetime import UTC, datetime
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -17,8 +17,6 @@ class TestMealsUpdateEndpoint:
     @pytest.mark.asyncio
     async def test_update_meal_description(self, api_client, authenticated_headers, test_user_data):
         """Should update meal description via PATCH"""
-        from datetime import datetime
-
         from calorie_track_ai_bot.schemas import Macronutrients, MealWithPhotos
 
         meal_id = uuid4()
@@ -75,8 +73,6 @@ class TestMealsUpdateEndpoint:
         self, api_client, authenticated_headers, test_user_data
     ):
         """Should update macronutrients and recalculate calories"""
-        from datetime import datetime
-
         from calorie_track_ai_bot.schemas import Macronutrients, MealWithPhotos
 
         meal_id = uuid4()
@@ -138,8 +134,6 @@ class TestMealsUpdateEndpoint:
         self, api_client, authenticated_headers, test_user_data
     ):
         """Should allow partial updates (only some fields)"""
-        from datetime import datetime
-
         from calorie_track_ai_bot.schemas import Macronutrients, MealWithPhotos
 
         meal_id = uuid4()
@@ -221,8 +215,6 @@ class TestMealsUpdateEndpoint:
         self, api_client, authenticated_headers, test_user_data
     ):
         """Should return 403 when trying to update another user's meal"""
-        from datetime import datetime
-
         from calorie_track_ai_bot.schemas import Macronutrients, MealWithPhotos
 
         # This meal belongs to a different user
@@ -7,7 +7,7 @@ import pytest
 
 
 @pytest.mark.asyncio
-async def test_create_single_photo(api_client, authenticated_headers, mock_db_pool):
+async def test_create_single_photo(async_client, authenticated_headers, mock_db_pool):
     """Test POST /api/v1/photos with single photo returns upload URL."""
     payload = {"photos": [{"content_type": "image/jpeg"}]}
 
@@ -21,7 +21,9 @@ async def test_create_single_photo(api_client, authenticated_headers, mock_db_po
         ),
         patch("calorie_track_ai_bot.api.v1.photos.db_create_photo", return_value=photo_id),
     ):
-        response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+        response = await async_client.post(
+            "/api/v1/photos", json=payload, headers=authenticated_headers
+        )
 
     assert response.status_code == 200
     data = response.json()
@@ -37,7 +39,7 @@ async def test_create_single_photo(api_client, authenticated_headers, mock_db_po
 
 
 @pytest.mark.asyncio
-async def test_create_multiple_photos(api_client, authenticated_headers, mock_db_pool):
+async def test_create_multiple_photos(async_client, authenticated_headers, mock_db_pool):
     """Test POST /api/v1/photos with multiple photos (up to 5)."""
     payload = {"photos": [{"content_type": "image/jpeg"} for i in range(3)]}
 
@@ -52,7 +54,9 @@ async def test_create_multiple_photos(api_client, authenticated_headers, mock_db
             side_effect=[str(uuid4()) for _ in range(3)],
         ),
     ):
-        response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+        response = await async_client.post(
+            "/api/v1/photos", json=payload, headers=authenticated_headers
+        )
 
     assert response.status_code == 200
     data = response.json()
@@ -67,7 +71,7 @@ async def test_create_multiple_photos(api_client, authenticated_headers, mock_db
 
 
 @pytest.mark.asyncio
-async def test_create_max_photos(api_client, authenticated_headers, mock_db_pool):
+async def test_create_max_photos(async_client, authenticated_headers, mock_db_pool):
     """Test POST /api/v1/photos with maximum 5 photos."""
     payload = {"photos": [{"content_type": "image/jpeg"} for i in range(5)]}
 
@@ -82,7 +86,9 @@ async def test_create_max_photos(api_client, authenticated_headers, mock_db_pool
             side_effect=[str(uuid4()) for _ in range(5)],
         ),
     ):
-        response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+        response = await async_client.post(
+            "/api/v1/photos", json=payload, headers=authenticated_headers
+        )
 
     assert response.status_code == 200
     data = response.json()
@@ -91,27 +97,31 @@ async def test_create_max_photos(api_client, authenticated_headers, mock_db_pool
 
 
 @pytest.mark.asyncio
-async def test_create_too_many_photos(api_client, authenticated_headers):
+async def test_create_too_many_photos(async_client, authenticated_headers):
     """Test POST /api/v1/photos with more than 5 photos returns 422."""
     payload = {"photos": [{"content_type": "image/jpeg"} for i in range(6)]}
 
-    response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+    response = await async_client.post(
+        "/api/v1/photos", json=payload, headers=authenticated_headers
+    )
 
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_create_empty_photos_list(api_client, authenticated_headers):
+async def test_create_empty_photos_list(async_client, authenticated_headers):
     """Test POST /api/v1/photos with empty photos list returns 422."""
     payload = {"photos": []}
 
-    response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+    response = await async_client.post(
+        "/api/v1/photos", json=payload, headers=authenticated_headers
+    )
 
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_create_photos_without_auth(api_client, mock_db_pool):
+async def test_create_photos_without_auth(async_client, mock_db_pool):
     """Test POST /api/v1/photos without authentication still works (endpoint is public)."""
     payload = {"photos": [{"content_type": "image/jpeg"}]}
 
@@ -123,14 +133,16 @@ async def test_create_photos_without_auth(api_client, mock_db_pool):
         ),
         patch("calorie_track_ai_bot.api.v1.photos.db_create_photo", return_value=str(uuid4())),
     ):
-        response = api_client.post("/api/v1/photos", json=payload)
+        response = await async_client.post("/api/v1/photos", json=payload)
 
     # Photos endpoint is public - it just creates upload URLs
     assert response.status_code == 200
 
 
 @pytest.mark.asyncio
-async def test_create_photos_invalid_content_type(api_client, authenticated_headers, mock_db_pool):
+async def test_create_photos_invalid_content_type(
+    async_client, authenticated_headers, mock_db_pool
+):
     """Test POST /api/v1/photos with invalid content type."""
     payload = {"photos": [{"content_type": "invalid/type"}]}
 
@@ -142,14 +154,16 @@ async def test_create_photos_invalid_content_type(api_client, authenticated_head
         ),
         patch("calorie_track_ai_bot.api.v1.photos.db_create_photo", return_value=str(uuid4())),
     ):
-        response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+        response = await async_client.post(
+            "/api/v1/photos", json=payload, headers=authenticated_headers
+        )
 
     # Should still succeed as content_type validation happens at upload time
     assert response.status_code == 200
 
 
 @pytest.mark.asyncio
-async def test_create_photos_mixed_content_types(api_client, authenticated_headers, mock_db_pool):
+async def test_create_photos_mixed_content_types(async_client, authenticated_headers, mock_db_pool):
     """Test POST /api/v1/photos with mixed content types."""
     payload = {
         "photos": [
@@ -170,7 +184,9 @@ async def test_create_photos_mixed_content_types(api_client, authenticated_heade
             side_effect=[str(uuid4()) for _ in range(3)],
         ),
     ):
-        response = api_client.post("/api/v1/photos", json=payload, headers=authenticated_headers)
+        response = await async_client.post(
+            "/api/v1/photos", json=payload, headers=authenticated_headers
+        )
 
     assert response.status_code == 200
     data = response.json()
@@ -1,11 +1,13 @@
 """Shared test fixtures and configuration."""
 
-import asyncio
+import logging
 import os
-from collections.abc import Generator
+import sys
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import pytest_asyncio
+import structlog
 
 # Set test environment variables at module level (before any imports)
 test_env_vars = {
@@ -64,6 +66,20 @@ with patch("calorie_track_ai_bot.services.queue.r") as mock_queue_redis:
     mock_queue_redis.brpop = Mock()
 
 
+def pytest_configure(config):
+    """Drop per-request INFO logging; warnings and errors still reach the report."""
+    logging.getLogger("calorie_track_ai_bot").setLevel(logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+def pytest_collection_finish(session):
+    """Fail fast if a test imported the app a second time through the ``src.`` path."""
+    if "src.calorie_track_ai_bot" in sys.modules:
+        raise pytest.UsageError(
+            "Import calorie_track_ai_bot directly, not via src.calorie_track_ai_bot"
+        )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_env():
     """Set up test environment variables."""
@@ -74,12 +90,10 @@ def setup_test_env():
             del os.environ[key]
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(autouse=True)
+def _no_real_http(respx_mock):
+    """Fail immediately on any outbound HTTPX request a test did not mock."""
+    yield respx_mock
 
 
 @pytest.fixture
@@ -133,6 +147,22 @@ def mock_db_pool():
         yield mock_pool, mock_conn
 
 
+@pytest.fixture(scope="class")
+def class_db_pool():
+    """Like ``mock_db_pool``, but patched once for a whole test class.
+
+    Yields ``(mock_get_pool, mock_conn)``; tests must not rely on call counts
+    unless they reset the mocks first.
+    """
+    mock_pool, mock_conn = _make_mock_pool()
+
+    with patch(
+        "calorie_track_ai_bot.services.database.get_pool", new_callable=AsyncMock
+    ) as mock_get_pool:
+        mock_get_pool.return_value = mock_pool
+        yield mock_get_pool, mock_conn
+
+
 @pytest.fixture
 def mock_redis_client():
     """Mock Redis client for testing."""
@@ -206,13 +236,43 @@ def test_user_data():
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application, imported once through its canonical module path."""
+    from calorie_track_ai_bot.main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Session-wide FastAPI test client.
+
+    Deliberately not entered: the app lifespan would start and close the real
+    bot, Redis client and DB pool. Each request runs on its own short-lived
+    event loop, so tasks a request schedules cannot outlive it.
+    """
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(app):
+    """Session-wide async client that dispatches straight to the ASGI app."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def api_client():
+def api_client(app):
     """FastAPI test client."""
     from fastapi.testclient import TestClient
 
-    from calorie_track_ai_bot.main import app
-
     return TestClient(app)
 
 
@@ -5,12 +5,11 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from calorie_track_ai_bot.main import app
 from calorie_track_ai_bot.schemas import InlineChatType, InlineTriggerType
 
 
 @pytest.fixture
-def client() -> TestClient:
+def client(app) -> TestClient:
     return TestClient(app)
 
 
@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from calorie_track_ai_bot.services.estimator import CalorieEstimator
+
 
 class TestMultiPhotoEstimation:
     """Test AI estimation service with multiple photos"""
@@ -21,7 +23,7 @@ class TestMultiPhotoEstimation:
             "https://storage.example.com/photo3.jpg",
         ]
 
-        # Mock the module-level OpenAI client before importing CalorieEstimator
+        # Mock the module-level OpenAI client before constructing CalorieEstimator
         with patch("calorie_track_ai_bot.services.estimator.client") as mock_client:
             # Mock OpenAI response with macronutrients
             mock_response = Mock()
@@ -39,8 +41,6 @@ class TestMultiPhotoEstimation:
             # Use Mock (not AsyncMock) because the OpenAI client is synchronous
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-            from calorie_track_ai_bot.services.estimator import CalorieEstimator
-
             estimator = CalorieEstimator()
 
             result = await estimator.estimate_from_photos(
@@ -70,8 +70,6 @@ class TestMultiPhotoEstimation:
     @pytest.mark.asyncio
     async def test_extract_macronutrients_from_response(self):
         """Should extract protein, carbs, fats in grams from AI response"""
-        from calorie_track_ai_bot.services.estimator import CalorieEstimator
-
         estimator = CalorieEstimator()
 
         ai_response = {
@@ -94,7 +92,7 @@ class TestMultiPhotoEstimation:
             "https://storage.example.com/photo2.jpg",
         ]
 
-        # Mock the module-level OpenAI client before importing CalorieEstimator
+        # Mock the module-level OpenAI client before constructing CalorieEstimator
         with patch("calorie_track_ai_bot.services.estimator.client") as mock_client:
             mock_response = Mock()
             mock_response.choices = [Mock()]
@@ -111,8 +109,6 @@ class TestMultiPhotoEstimation:
             # Use Mock (not AsyncMock) because the OpenAI client is synchronous
             mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-            from calorie_track_ai_bot.services.estimator import CalorieEstimator
-
             estimator = CalorieEstimator()
 
             # No description provided
@@ -129,7 +125,7 @@ class TestMultiPhotoEstimation:
         for count in [1, 2, 3, 4, 5]:
             photo_urls = [f"https://storage.example.com/photo{i}.jpg" for i in range(count)]
 
-            # Mock the module-level OpenAI client before importing CalorieEstimator
+            # Mock the module-level OpenAI client before constructing CalorieEstimator
             with patch("calorie_track_ai_bot.services.estimator.client") as mock_client:
                 mock_response = Mock()
                 mock_response.choices = [Mock()]
@@ -146,8 +142,6 @@ class TestMultiPhotoEstimation:
                 # Use Mock (not AsyncMock) because the OpenAI client is synchronous
                 mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-                from calorie_track_ai_bot.services.estimator import CalorieEstimator
-
                 estimator = CalorieEstimator()
 
                 result = await estimator.estimate_from_photos(photo_urls=photo_urls)
@@ -157,8 +151,6 @@ class TestMultiPhotoEstimation:
     @pytest.mark.asyncio
     async def test_partial_photo_upload_handling(self):
         """Should handle case where some photos fail to upload"""
-        from calorie_track_ai_bot.services.estimator import CalorieEstimator
-
         estimator = CalorieEstimator()
 
         # Mix of valid and None URLs (representing failed uploads)
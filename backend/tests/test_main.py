@@ -1,19 +1,22 @@
 """Tests for main application."""
 
+import asyncio
+from typing import Any, Literal
 from unittest.mock import patch
 from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import AwareDatetime, BaseModel, Field
 
-from calorie_track_ai_bot.main import app
+from calorie_track_ai_bot.services import database
 
 
 class TestMainApplication:
     """Test main FastAPI application."""
 
     @pytest.fixture
-    def client(self):
+    def client(self, app):
         """Create test client."""
         return TestClient(app)
 
@@ -166,47 +169,49 @@ class TestMainApplication:
             assert path in paths, f"Path {path} not found in OpenAPI schema"
 
 
+class _ConnectivityContract(BaseModel):
+    """Client-side contract for /health/connectivity, independent of the app's model."""
+
+    status: Literal["connected", "disconnected", "error"]
+    services: dict[str, Any]
+    response_time_ms: float = Field(ge=0, strict=True)
+    correlation_id: UUID
+    timestamp: AwareDatetime
+
+
 class TestHealthConnectivity:
     """Contract tests for the /health/connectivity endpoint."""
 
     @pytest.fixture
-    def client(self):
+    def client(self, app):
         """Create test client."""
         return TestClient(app)
 
+    @pytest.fixture(autouse=True)
+    def _no_db_pool(self, monkeypatch):
+        """Report the pool as not yet opened so the check skips its database ping."""
+        monkeypatch.setattr(database, "_pool", None)
+
     def test_connectivity_returns_valid_schema(self, client):
         """Test that GET /health/connectivity returns 200 with valid response schema."""
         response = client.get("/health/connectivity")
 
         assert response.status_code == 200
 
-        data = response.json()
-        assert "status" in data
-        assert "response_time_ms" in data
-        assert "timestamp" in data
-        assert "correlation_id" in data
-
-        # Validate field types and constraints
-        assert data["status"] in ["connected", "disconnected", "error"]
-        assert isinstance(data["response_time_ms"], int | float)
-        assert data["response_time_ms"] >= 0
-        assert isinstance(data["timestamp"], str)
-        assert isinstance(data["correlation_id"], str)
+        # Checks the status values, non-negative timing, UUID and aware ISO 8601 timestamp
+        _ConnectivityContract.model_validate(response.json())
 
-        # Validate correlation_id is a valid UUID
-        UUID(data["correlation_id"])
-
-        # Validate timestamp format (ISO 8601)
-        from datetime import datetime
-
-        datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
-
-    def test_connectivity_idempotency(self, client):
+    async def test_connectivity_idempotency(self, async_client):
         """Test that multiple calls return unique correlation IDs."""
-        responses = [client.get("/health/connectivity") for _ in range(3)]
+        responses = await asyncio.gather(
+            *(async_client.get("/health/connectivity") for _ in range(3))
+        )
 
         for response in responses:
             assert response.status_code == 200
 
-        correlation_ids = [response.json()["correlation_id"] for response in responses]
-        assert len(set(correlation_ids)) == 3
+        correlation_ids = {
+            _ConnectivityContract.model_validate(response.json()).correlation_id
+            for response in responses
+        }
+        assert len(correlation_ids) == 3